@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+A/B Config Comparison for Stack & Slice
+Paired QA/FEEL comparison of two bot configurations driven by common random numbers
+"""
+
+import argparse
+import math
+import os
+from datetime import datetime
+from statistics import NormalDist
+
+from artifact_manifest import write_artifact
+from qa_autoplay_bot import QAAutoplayBot, QAStats, RunningMoments, np
+from feel_optimizer import FeelDataset, FeelOptimizer
+from qa_sweep import point_config
+
+def parse_overrides(specs):
+    """Parse ['name=value', ...] into a dict of float overrides"""
+    overrides = {}
+    for spec in specs or []:
+        name, _, value = spec.partition('=')
+        if not name or not value:
+            raise ValueError(f"Invalid override '{spec}', expected name=value")
+        overrides[name] = float(value)
+    return overrides
+
+def feel_score(stats):
+    """FEEL score from aggregated session stats"""
+    optimizer = FeelOptimizer()
+    optimizer.dataset = FeelDataset(base_stats=stats)
+    return optimizer.score_feel()[0]
+
+class PairedComparison:
+    """Runs configs A and B on the same random streams and tracks paired differences"""
+    
+    def __init__(self, config_a, config_b):
+        self.bot_a = QAAutoplayBot()
+        self.bot_a.set_config(config_a)
+        self.bot_b = QAAutoplayBot()
+        self.bot_b.set_config(config_b)
+        
+        self.qa_diff = RunningMoments()  # Per-session QA contribution B - A
+        self.qa_a = RunningMoments()
+        self.qa_b = RunningMoments()
+        self.feel_diff = RunningMoments()  # Per-block FEEL B - A (FEEL is not a per-session mean)
+        self.result = None
+    
+    def run(self, runs, block_size=10_000, seed=None, confidence=0.95, stop_early=False):
+        """Simulate paired blocks until `runs` sessions or, with stop_early, a confident verdict"""
+        blocks = math.ceil(runs / block_size)
+        alpha = 1 - confidence
+        # Bonferroni over every look when stopping early
+        z = NormalDist().inv_cdf(1 - alpha / (2 * blocks if stop_early else 2))
+        
+        root = np.random.SeedSequence(seed)
+        completed = 0
+        for block_seed in root.spawn(blocks):
+            count = min(block_size, runs - completed)
+            # Identical seeds: both configs consume the same uniforms session by session
+            columns_a = self.bot_a.simulate_batch(count, np.random.default_rng(block_seed))
+            columns_b = self.bot_b.simulate_batch(count, np.random.default_rng(block_seed))
+            completed += count
+            
+            contrib_a = self.bot_a.session_qa_contributions(columns_a)
+            contrib_b = self.bot_b.session_qa_contributions(columns_b)
+            self.qa_a.add_array(contrib_a)
+            self.qa_b.add_array(contrib_b)
+            self.qa_diff.add_array(contrib_b - contrib_a)
+            
+            block_a, block_b = QAStats(), QAStats()
+            block_a.add_columns(columns_a)
+            block_b.add_columns(columns_b)
+            self.bot_a.stats.merge(block_a)
+            self.bot_b.stats.merge(block_b)
+            self.feel_diff.add(feel_score(block_b) - feel_score(block_a))
+            
+            # At least two blocks so the FEEL batch-means variance exists
+            if stop_early and self.feel_diff.count > 1:
+                se = self._standard_error(self.qa_diff)
+                if abs(self.qa_diff.mean) > z * se:
+                    break
+        
+        self.result = self._summarize(z, confidence)
+        return self.result
+    
+    def _standard_error(self, moments):
+        """Standard error of a mean from a population-variance accumulator"""
+        if moments.count < 2:
+            return float('inf')
+        return math.sqrt(moments.variance() * moments.count / (moments.count - 1) / moments.count)
+    
+    def _summarize(self, z, confidence):
+        """Paired differences, their intervals and the variance reduction achieved"""
+        for bot in (self.bot_a, self.bot_b):
+            bot.calculate_metrics()
+        
+        qa_se = self._standard_error(self.qa_diff)
+        feel_se = self._standard_error(self.feel_diff)
+        independent_variance = self.qa_a.variance() + self.qa_b.variance()
+        paired_variance = self.qa_diff.variance()
+        
+        qa_diff = self.bot_b.calculate_qa_score() - self.bot_a.calculate_qa_score()
+        feel_diff = feel_score(self.bot_b.stats) - feel_score(self.bot_a.stats)
+        
+        if abs(self.qa_diff.mean) <= z * qa_se:
+            verdict = 'NO_SIGNIFICANT_DIFFERENCE'
+        else:
+            verdict = 'B_BETTER' if self.qa_diff.mean > 0 else 'A_BETTER'
+        
+        return {
+            'sessions': self.qa_diff.count,
+            'confidence': confidence,
+            'qa_a': self.bot_a.calculate_qa_score(),
+            'qa_b': self.bot_b.calculate_qa_score(),
+            'qa_diff': qa_diff,
+            'qa_diff_variance': qa_se ** 2,
+            'qa_diff_ci': (qa_diff - z * qa_se, qa_diff + z * qa_se),
+            'feel_a': feel_score(self.bot_a.stats),
+            'feel_b': feel_score(self.bot_b.stats),
+            'feel_diff': feel_diff,
+            'feel_diff_variance': feel_se ** 2,
+            'feel_diff_ci': (feel_diff - z * feel_se, feel_diff + z * feel_se),
+            'variance_reduction': independent_variance / paired_variance if paired_variance > 0 else float('inf'),
+            'verdict': verdict
+        }
+    
+    def generate_report(self, overrides_a, overrides_b, report_path='docs/AB_COMPARE.md'):
+        """Write the paired comparison report"""
+        r = self.result
+        report_content = f"""# A/B Config Comparison
+
+## Configurations
+- **A**: {overrides_a or 'baseline'}
+- **B**: {overrides_b or 'baseline'}
+- **Paired Sessions**: {r['sessions']} (common random numbers)
+
+## Paired Differences (B - A)
+| Score | A | B | Difference | Variance | {r['confidence']:.0%} CI |
+|-------|---|---|------------|----------|--------|
+| QA | {r['qa_a']:.4f} | {r['qa_b']:.4f} | {r['qa_diff']:+.4f} | {r['qa_diff_variance']:.2e} | {r['qa_diff_ci'][0]:+.4f} to {r['qa_diff_ci'][1]:+.4f} |
+| FEEL | {r['feel_a']:.4f} | {r['feel_b']:.4f} | {r['feel_diff']:+.4f} | {r['feel_diff_variance']:.2e} | {r['feel_diff_ci'][0]:+.4f} to {r['feel_diff_ci'][1]:+.4f} |
+
+## Verdict
+- **Result**: {r['verdict']}
+- **Variance Reduction vs Independent Runs**: {r['variance_reduction']:.1f}x
+
+---
+*Generated by QABalancer at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+"""
+        
+        if write_artifact(report_path, report_content):
+            print(f"[ABCompare] Comparison report generated: {report_path}")
+        else:
+            print(f"[ABCompare] Comparison report unchanged: {report_path}")
+        return report_path
+
+def main():
+    """Main function to compare two bot configurations"""
+    parser = argparse.ArgumentParser(description="Paired A/B comparison of QA bot configurations")
+    parser.add_argument('--a', action='append', metavar='NAME=VALUE', help="Override for config A")
+    parser.add_argument('--b', action='append', metavar='NAME=VALUE', help="Override for config B")
+    parser.add_argument('--runs', type=int, default=200_000, help="Paired sessions (budget with --stop-early)")
+    parser.add_argument('--block-size', type=int, default=10_000, help="Sessions per paired block")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed")
+    parser.add_argument('--confidence', type=float, default=0.95, help="Confidence level")
+    parser.add_argument('--stop-early', action='store_true', help="Stop once the QA verdict is confident")
+    parser.add_argument('--gameplay', action='store_true', help="Use the headless gameplay simulator")
+    args = parser.parse_args()
+    
+    if np is None:
+        print("[ABCompare] Error: NumPy is required (pip install numpy)")
+        return
+    
+    base = QAAutoplayBot()
+    if args.gameplay:
+        base.engine = 'gameplay'
+    try:
+        overrides_a = parse_overrides(args.a)
+        overrides_b = parse_overrides(args.b)
+        config_a = point_config(base.get_config(), overrides_a)
+        config_b = point_config(base.get_config(), overrides_b)
+    except ValueError as e:
+        print(f"[ABCompare] Error: {e}")
+        return
+    
+    os.makedirs('docs', exist_ok=True)
+    comparison = PairedComparison(config_a, config_b)
+    result = comparison.run(args.runs, block_size=args.block_size, seed=args.seed,
+                            confidence=args.confidence, stop_early=args.stop_early)
+    
+    print(f"[ABCompare] {result['sessions']} paired sessions")
+    print(f"  - QA B-A: {result['qa_diff']:+.4f} "
+          f"(CI {result['qa_diff_ci'][0]:+.4f} to {result['qa_diff_ci'][1]:+.4f})")
+    print(f"  - FEEL B-A: {result['feel_diff']:+.4f} "
+          f"(CI {result['feel_diff_ci'][0]:+.4f} to {result['feel_diff_ci'][1]:+.4f})")
+    print(f"  - Variance reduction: {result['variance_reduction']:.1f}x")
+    print(f"[ABCompare] Verdict: {result['verdict']}")
+    
+    comparison.generate_report(overrides_a, overrides_b)
+
+if __name__ == "__main__":
+    main()
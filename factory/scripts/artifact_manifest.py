@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Artifact Manifest for the AI Game Factory
+Content hashes of generated reports, ignoring volatile lines, so unchanged artifacts are neither rewritten nor committed
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from atomic_file import atomic_write, file_lock, file_stamp, read_bytes
+
+MANIFEST_NAME = '.artifacts.json'
+# Footer lines like "*Generated by StudioBrain at 2024-01-01 12:00:00*" change on every run
+VOLATILE_LINES = re.compile(rb'^\*Generated by [^\n*]* at [^\n*]*\*\r?$', re.MULTILINE)
+
+def normalized_digest(data):
+    """SHA-256 of content (bytes or str) with volatile lines blanked out"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(VOLATILE_LINES.sub(b'', data)).hexdigest()
+
+class ArtifactManifest:
+    """Per-directory record of each artifact's normalized digest, as written and as last committed
+    
+    Entries also keep the file stamp seen at write time, so edits made outside the writers
+    (or a fresh checkout) fall back to hashing the file instead of trusting the manifest.
+    """
+    
+    def __init__(self, directory='docs'):
+        self.directory = directory
+        self.path = os.path.join(directory, MANIFEST_NAME)
+        self.entries = self._read()
+    
+    def _read(self):
+        raw = read_bytes(self.path)
+        return json.loads(raw) if raw else {}
+    
+    def _save(self, names):
+        """Merge this process's entries for `names` into the manifest on disk"""
+        with file_lock(self.path):
+            entries = self._read()
+            for name in names:
+                entries[name] = self.entries[name]
+            atomic_write(self.path, json.dumps(entries, indent=2, sort_keys=True))
+            self.entries = entries
+    
+    def current_digest(self, name):
+        """Normalized digest of the file as it is now, or None if it does not exist"""
+        path = os.path.join(self.directory, name)
+        entry = self.entries.get(name, {})
+        stamp = file_stamp(path)
+        if stamp is None:
+            return None
+        if entry.get('stamp') == list(stamp):
+            return entry['digest']
+        return normalized_digest(read_bytes(path))
+    
+    def write(self, name, content):
+        """Write `content` unless the file already has it up to volatile lines; returns True if written"""
+        digest = normalized_digest(content)
+        if self.current_digest(name) == digest:
+            return False
+        
+        path = os.path.join(self.directory, name)
+        atomic_write(path, content)
+        entry = self.entries.setdefault(name, {})
+        entry.update(digest=digest, stamp=list(file_stamp(path)))
+        self._save([name])
+        return True
+    
+    def changed(self, names):
+        """Names whose content differs from what was last committed"""
+        return [name for name in names
+                if self.current_digest(name) != self.entries.get(name, {}).get('committed')]
+    
+    def mark_committed(self, names):
+        """Record the current content of `names` as committed"""
+        for name in names:
+            entry = self.entries.setdefault(name, {})
+            digest = self.current_digest(name)
+            stamp = file_stamp(os.path.join(self.directory, name))
+            entry.update(digest=digest, committed=digest, stamp=list(stamp) if stamp else None)
+        self._save(names)
+
+def _manifests(paths):
+    """(manifest, name, path) for each path, loading one manifest per directory"""
+    manifests = {}
+    for path in paths:
+        directory, name = os.path.split(path)
+        if directory not in manifests:
+            manifests[directory] = ArtifactManifest(directory or '.')
+        yield manifests[directory], name, path
+
+def write_artifact(path, content):
+    """Write a generated artifact only if its normalized content changed; returns True if written"""
+    directory, name = os.path.split(path)
+    return ArtifactManifest(directory or '.').write(name, content)
+
+def changed_artifacts(paths):
+    """Subset of `paths` whose normalized content differs from the last commit"""
+    return [path for manifest, name, path in _manifests(paths) if manifest.changed([name])]
+
+def mark_committed(paths):
+    """Record the current content of `paths` as committed"""
+    groups = {}
+    for manifest, name, _ in _manifests(paths):
+        groups.setdefault(manifest.path, (manifest, []))[1].append(name)
+    for manifest, names in groups.values():
+        manifest.mark_committed(names)
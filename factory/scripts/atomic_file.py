@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Atomic File Helpers for the AI Game Factory
+Advisory file locks and write-to-temp-then-rename replacement shared by the memory stores
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: byte-range locks through msvcrt instead
+    fcntl = None
+    import msvcrt
+
+@contextmanager
+def file_lock(path, timeout=30.0, shared=False):
+    """Hold an advisory lock on `path`.lock for the duration of the block
+    
+    Shared locks admit other shared holders and exclude exclusive ones (on Windows every
+    lock is exclusive). Locks are not reentrant, even within one process.
+    """
+    lock_path = path + '.lock'
+    deadline = time.monotonic() + timeout
+    with open(lock_path, 'a+') as f:
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {lock_path}")
+                time.sleep(0.005)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def read_bytes(path):
+    """File contents, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def atomic_write(path, text):
+    """Replace `path` with `text` so readers see either the old or the new file, never a partial one"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def file_stamp(path):
+    """(inode, mtime_ns, size) of `path`, or None; changes whenever the file is rewritten or replaced"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
@@ -3,23 +3,14 @@
 Auto Commit Script - QA/FEEL eşiklerine göre otomatik commit/branch etiketi
 """
 
-import json
 import subprocess
 import sys
-from datetime import datetime
 
-def load_memory():
-    """Load memory configuration from docs/MEMORY.json"""
-    try:
-        with open('docs/MEMORY.json', 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"active_game": None, "build": 0, "last_qa": 0, "last_feel": 0, "pending": []}
+from artifact_manifest import changed_artifacts, mark_committed
+from git_sync import ARTIFACT_PATHS, GitSyncer
+from memory_sync import export_memory, update_memory
 
-def save_memory(memory):
-    """Save memory configuration to docs/MEMORY.json"""
-    with open('docs/MEMORY.json', 'w') as f:
-        json.dump(memory, f, indent=2)
+RESERVED_FIELDS = ["build", "last_qa", "last_feel"]
 
 def get_qa_score():
     """Get current QA score (placeholder implementation)"""
@@ -39,10 +30,31 @@ def create_commit_message(game_name, feel_score, qa_score, build_number):
     """Create commit message in required format"""
     return f"[AUTO][{game_name}] FEEL={feel_score:.2f} QA={qa_score:.2f} BUILD={build_number}"
 
-def auto_commit():
-    """Main auto commit logic"""
-    memory = load_memory()
+def reserve_build(qa_score, feel_score):
+    """Record the scores and take the next build number atomically; returns (memory, previous values)"""
+    previous = {}
+    
+    def reserve(memory):
+        # update_memory may retry the mutator, so the previous values are captured on every attempt
+        previous.clear()
+        previous.update({name: memory[name] for name in RESERVED_FIELDS if name in memory})
+        memory.update(build=memory.get("build", 0) + 1, last_qa=qa_score, last_feel=feel_score)
+    
+    return update_memory(reserve), previous
+
+def release_build(build, previous):
+    """Undo reserve_build after a failed commit, unless a later run has reserved a build since"""
+    def release(memory):
+        if memory.get("build") == build:
+            for name in RESERVED_FIELDS:
+                memory.pop(name, None)
+            memory.update(previous)
     
+    update_memory(release)
+    export_memory()
+
+def auto_commit(extra_paths=()):
+    """Main auto commit logic; commits the factory artifacts plus any extra paths (e.g. Assets/)"""
     # Get current scores
     qa_score = get_qa_score()
     feel_score = get_feel_score()
@@ -52,10 +64,9 @@ def auto_commit():
         print(f"Quality gates not met: QA={qa_score:.2f}, FEEL={feel_score:.2f}")
         return False
     
-    # Update memory
-    memory["last_qa"] = qa_score
-    memory["last_feel"] = feel_score
-    memory["build"] += 1
+    # Reserve the build number before committing so parallel runs never share one; MEMORY.json
+    # goes into the same commit, and a failed commit hands the number and old scores back
+    memory, previous = reserve_build(qa_score, feel_score)
     
     # Create commit message
     game_name = memory.get("active_game", "UNKNOWN")
@@ -63,21 +74,28 @@ def auto_commit():
     
     # Perform git operations
     try:
-        # Add all changes
-        subprocess.run(["git", "add", "."], check=True)
-        
-        # Commit with message
-        subprocess.run(["git", "commit", "-m", commit_message], check=True)
-        
+        # Stage only artifacts whose content changed (ignoring timestamps) plus explicit paths:
+        # scanning the whole tree is slow on large Unity projects
+        export_memory()
+        artifacts = changed_artifacts(ARTIFACT_PATHS)
+        paths = artifacts + list(extra_paths)
+        if not GitSyncer(paths).commit(commit_message, paths):
+            print("Nothing to commit")
+            release_build(memory["build"], previous)
+            return False
+    except subprocess.CalledProcessError as e:
+        print(f"Git commit failed: {e}")
+        release_build(memory["build"], previous)
+        return False
+    mark_committed(artifacts)
+    
+    try:
         # Create tag if build is significant
         if memory["build"] % 10 == 0:
             tag_name = f"v{memory['build']}"
             subprocess.run(["git", "tag", tag_name], check=True)
             print(f"Created tag: {tag_name}")
         
-        # Save updated memory
-        save_memory(memory)
-        
         print(f"Commit successful: {commit_message}")
         return True
         
@@ -86,5 +104,5 @@ def auto_commit():
         return False
 
 if __name__ == "__main__":
-    success = auto_commit()
+    success = auto_commit(sys.argv[1:])
     sys.exit(0 if success else 1)
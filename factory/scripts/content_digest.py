@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Content Digests for the AI Game Factory
+Hashes of script sources and input files used as cache keys by the pipeline and the QA sweep
+"""
+
+import hashlib
+import os
+
+# Resolved at import so workers that chdir into a game workspace still find the sources
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def code_digest(modules):
+    """Hash of the given script modules (file names in the scripts directory)"""
+    digest = hashlib.sha256()
+    for name in modules:
+        with open(os.path.join(SCRIPT_DIR, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def file_digest(path):
+    """Hash of an input file's content, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Decision Log for the AI Game Factory
+Append-only JSONL history of StudioBrain decisions and pending tasks with byte-offset indexes
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+from contextlib import contextmanager
+from datetime import datetime
+
+from atomic_file import atomic_write, file_lock
+
+INDEXED_FIELDS = ['kind', 'game', 'decision', 'build']
+TIME_ENTRY = struct.Struct('<dQ8s')  # (epoch seconds, byte offset, line digest) per record, in append order
+OFFSET_ENTRY = struct.Struct('<Q')  # Byte offset per record in a field index
+
+def line_digest(line):
+    """Short content hash of one log line, kept in the time index to detect a replaced log"""
+    return hashlib.blake2b(line, digest_size=8).digest()
+
+class DecisionLog:
+    """Append-only record log with per-field offset indexes
+    
+    The JSONL log is the source of truth; index files are derived and rebuilt when missing
+    or behind the log, so they can stay out of git. Nothing touches the disk until the first
+    write, or the first read of an existing log. Writers hold the log lock exclusively and
+    readers share it, so a compaction rebuilding the indexes is never seen half done.
+    """
+    
+    def __init__(self, log_path='docs/DECISION_LOG.jsonl', index_dir='docs/decision_log.idx'):
+        self.log_path = log_path
+        self.index_dir = index_dir
+        self._recovered = False
+    
+    @contextmanager
+    def _writing(self):
+        """Exclusive log lock, with the indexes brought up to date on first use"""
+        os.makedirs(self.index_dir, exist_ok=True)
+        with file_lock(self.log_path):
+            if not self._recovered:
+                self._recover()
+                self._recovered = True
+            yield
+    
+    @contextmanager
+    def _reading(self):
+        """Shared log lock for index readers; callers check that the log exists first"""
+        if not self._recovered:
+            with self._writing():
+                pass
+        with file_lock(self.log_path, shared=True):
+            yield
+    
+    def _time_index_path(self):
+        return os.path.join(self.index_dir, 'timeline.idx')
+    
+    def _field_index_path(self, field, value):
+        digest = hashlib.sha1(json.dumps(value).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.index_dir, f"{field}-{digest}.idx")
+    
+    def _recover(self):
+        """Bring the indexes up to date with the log (after a crash, a compaction or a fresh clone)"""
+        if not os.path.exists(self.log_path):
+            self._clear_indexes()
+            return
+        
+        # A torn final line from an interrupted append is dropped
+        size = os.path.getsize(self.log_path)
+        with open(self.log_path, 'rb+') as f:
+            if size:
+                f.seek(max(0, size - 1))
+                if f.read(1) != b'\n':
+                    f.seek(0)
+                    data = f.read()
+                    size = data.rfind(b'\n') + 1
+                    f.truncate(size)
+        
+        indexed_end = 0
+        time_path = self._time_index_path()
+        if os.path.exists(time_path) and os.path.getsize(time_path) >= TIME_ENTRY.size:
+            with open(time_path, 'rb') as f:
+                f.seek(-TIME_ENTRY.size, os.SEEK_END)
+                _, last_offset, digest = TIME_ENTRY.unpack(f.read(TIME_ENTRY.size))
+            with open(self.log_path, 'rb') as f:
+                f.seek(last_offset)
+                line = f.readline()
+            # The last indexed line must still be there byte for byte, not just fit in the file
+            if line_digest(line) == digest:
+                indexed_end = last_offset + len(line)
+        
+        if not indexed_end:
+            # Indexes are missing or describe a different log: rebuild them from the start
+            self._clear_indexes()
+            indexed_end = 0
+        
+        if indexed_end < size:
+            with open(self.log_path, 'rb') as f:
+                f.seek(indexed_end)
+                offset = indexed_end
+                for line in f:
+                    self._index_record(json.loads(line), offset, line)
+                    offset += len(line)
+    
+    def _clear_indexes(self):
+        for name in os.listdir(self.index_dir):
+            if name.endswith('.idx'):
+                os.remove(os.path.join(self.index_dir, name))
+    
+    def _index_record(self, record, offset, line):
+        """Append one record's offset to the time index and its field indexes (O(1))"""
+        with open(self._time_index_path(), 'ab') as f:
+            f.write(TIME_ENTRY.pack(record['ts'], offset, line_digest(line)))
+        for field in INDEXED_FIELDS:
+            if record.get(field) is not None:
+                with open(self._field_index_path(field, record[field]), 'ab') as f:
+                    f.write(OFFSET_ENTRY.pack(offset))
+    
+    def _read_offsets(self, path, last=None):
+        """Offsets stored in an index file, optionally only the last N"""
+        try:
+            with open(path, 'rb') as f:
+                if last is not None:
+                    f.seek(-min(last * OFFSET_ENTRY.size, os.path.getsize(path)), os.SEEK_END)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        return [value for (value,) in OFFSET_ENTRY.iter_unpack(data)]
+    
+    def _time_offsets(self, start=None, end=None, last=None):
+        """Offsets of records with start <= ts < end, or the last N, by binary search over the time index"""
+        path = self._time_index_path()
+        if not os.path.exists(path):
+            return []
+        entries = os.path.getsize(path) // TIME_ENTRY.size
+        
+        with open(path, 'rb') as f:
+            def entry_time(position):
+                f.seek(position * TIME_ENTRY.size)
+                return TIME_ENTRY.unpack(f.read(TIME_ENTRY.size))[0]
+            
+            def position_of(ts):
+                lo, hi = 0, entries
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if entry_time(mid) < ts:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                return lo
+            
+            lo = position_of(start) if start is not None else 0
+            hi = position_of(end) if end is not None else entries
+            if last is not None:
+                lo = max(lo, hi - last)
+            f.seek(lo * TIME_ENTRY.size)
+            data = f.read((hi - lo) * TIME_ENTRY.size)
+        return [offset for _, offset, _ in TIME_ENTRY.iter_unpack(data)]
+    
+    def _read_records(self, offsets):
+        if not offsets:
+            return []
+        records = []
+        with open(self.log_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                records.append(json.loads(f.readline()))
+        return records
+    
+    def append(self, record):
+        """Append a record (dict with at least 'kind'); returns it with its timestamp fields"""
+        # Writers take the log lock so each record's offset and index entries match its position
+        with self._writing():
+            return self._append(record)
+    
+    def _append(self, record):
+        return self._extend([record])[0]
+    
+    def extend(self, records):
+        """Append several records with one lock and one write; returns them with timestamp fields"""
+        with self._writing():
+            return self._extend(records)
+    
+    def _extend(self, records):
+        now = datetime.now()
+        stamped, lines = [], []
+        for record in records:
+            record = dict(record)
+            record.setdefault('timestamp', now.isoformat())
+            record['ts'] = now.timestamp()
+            stamped.append(record)
+            lines.append((json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8'))
+        
+        with open(self.log_path, 'ab') as f:
+            offset = f.tell()
+            f.write(b''.join(lines))
+        for record, line in zip(stamped, lines):
+            self._index_record(record, offset, line)
+            offset += len(line)
+        return stamped
+    
+    def count(self, field, value):
+        """Number of records with record[field] == value (index size, O(1))"""
+        if not os.path.exists(self.log_path):
+            return 0
+        with self._reading():
+            return self._count(field, value)
+    
+    def _count(self, field, value):
+        try:
+            return os.path.getsize(self._field_index_path(field, value)) // OFFSET_ENTRY.size
+        except FileNotFoundError:
+            return 0
+    
+    def last(self, n=10, **filters):
+        """Most recent N records matching all filters (e.g. game='StackSlice', decision='BUILD_EXPORT')"""
+        unknown = set(filters) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Not indexed: {sorted(unknown)} (indexed fields: {INDEXED_FIELDS})")
+        if not os.path.exists(self.log_path):
+            return []
+        with self._reading():
+            return self._last(n, **filters)
+    
+    def _last(self, n, **filters):
+        if not filters:
+            return self._read_records(self._time_offsets(last=n))
+        
+        # Walk the smallest matching index backwards, checking the remaining filters
+        field, value = min(filters.items(), key=lambda item: self._count(*item))
+        path = self._field_index_path(field, value)
+        matches = []
+        window = n
+        while True:
+            offsets = self._read_offsets(path, last=window)
+            matches = [record for record in self._read_records(offsets)
+                       if all(record.get(k) == v for k, v in filters.items())]
+            if len(matches) >= n or len(offsets) < window:
+                return matches[-n:]
+            window *= 4
+    
+    def between(self, start=None, end=None):
+        """Records with start <= timestamp < end (datetimes or epoch seconds), by binary search"""
+        start = start.timestamp() if isinstance(start, datetime) else start
+        end = end.timestamp() if isinstance(end, datetime) else end
+        if not os.path.exists(self.log_path):
+            return []
+        with self._reading():
+            return self._read_records(self._time_offsets(start, end))
+    
+    def next_task_id(self):
+        """Next task id, stable across compactions"""
+        if not os.path.exists(self.log_path):
+            return 0
+        with self._reading():
+            return self._next_task_id()
+    
+    def _next_task_id(self):
+        next_id = 0
+        for kind in ('task', 'checkpoint'):
+            records = self._last(1, kind=kind)
+            if records:
+                next_id = max(next_id, records[0].get('task_id', -1) + 1, records[0].get('next_task_id', 0))
+        return next_id
+    
+    def add_task(self, task, **fields):
+        """Append a pending task; returns its id"""
+        return self.add_tasks([task], **fields)[0]
+    
+    def add_tasks(self, tasks, **fields):
+        """Append pending tasks in one write; returns their ids"""
+        with self._writing():
+            first = self._next_task_id()
+            self._extend([dict(fields, kind='task', task_id=first + i, task=task, status='pending')
+                          for i, task in enumerate(tasks)])
+        return list(range(first, first + len(tasks)))
+    
+    def complete_task(self, task_id):
+        """Append a completion for an existing task id"""
+        return bool(self.complete_tasks([task_id]))
+    
+    def complete_tasks(self, task_ids):
+        """Append completions for the existing ids among task_ids in one write; returns those ids"""
+        with self._writing():
+            # Under the lock so an id handed out by a concurrent add_tasks is not rejected
+            next_id = self._next_task_id()
+            valid = [task_id for task_id in task_ids if 0 <= task_id < next_id]
+            if valid:
+                self._extend([{'kind': 'task_update', 'task_id': task_id, 'status': 'completed'} for task_id in valid])
+        return valid
+    
+    def tasks(self):
+        """Every task folded with its updates, in id order"""
+        if not os.path.exists(self.log_path):
+            return []
+        with self._reading():
+            return self._tasks()
+    
+    def _tasks(self):
+        tasks = {}
+        offsets = sorted(self._read_offsets(self._field_index_path('kind', 'task')) +
+                         self._read_offsets(self._field_index_path('kind', 'task_update')))
+        for record in self._read_records(offsets):
+            if record['kind'] == 'task':
+                tasks[record['task_id']] = record
+            elif record['task_id'] in tasks:
+                tasks[record['task_id']] = dict(tasks[record['task_id']], status=record['status'],
+                                                completed_at=record['timestamp'])
+        return [tasks[task_id] for task_id in sorted(tasks)]
+    
+    def pending_tasks(self):
+        """Tasks not completed yet"""
+        return [task for task in self.tasks() if task['status'] == 'pending']
+    
+    def compact(self, keep_decisions=100):
+        """Rewrite the log without completed tasks and with only the last N decisions per game"""
+        if not os.path.exists(self.log_path):
+            return 0, 0
+        with self._writing():
+            return self._compact(keep_decisions)
+    
+    def _compact(self, keep_decisions):
+        next_id = self._next_task_id()
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        
+        completed = {r['task_id'] for r in records if r['kind'] == 'task_update' and r['status'] == 'completed'}
+        per_game = {}
+        for r in records:
+            if r['kind'] == 'decision':
+                per_game.setdefault(r.get('game'), []).append(id(r))
+        kept_decisions = {key for ids in per_game.values() for key in ids[-keep_decisions:]}
+        
+        kept = [
+            r for r in records
+            if (r['kind'] == 'decision' and id(r) in kept_decisions)
+            or (r['kind'] == 'task' and r['task_id'] not in completed)
+            or r['kind'] not in ('decision', 'task', 'task_update', 'checkpoint')
+        ]
+        
+        now = datetime.now()
+        # The checkpoint keeps task ids increasing after completed tasks are dropped
+        header = {'kind': 'checkpoint', 'reason': 'compaction', 'next_task_id': next_id,
+                  'removed': len(records) - len(kept),
+                  'timestamp': now.isoformat(), 'ts': min([now.timestamp()] + [r['ts'] for r in kept])}
+        atomic_write(self.log_path, ''.join(json.dumps(record, separators=(',', ':')) + '\n'
+                                            for record in [header] + kept))
+        
+        self._clear_indexes()
+        self._recover()
+        return len(records), len(kept) + 1
+
+def migrate_pending(memory, log):
+    """Move a legacy MEMORY.json 'pending' list into the log; returns True if memory changed"""
+    pending = memory.pop('pending', None)
+    if pending is None:
+        return False
+    
+    for position, entry in enumerate(pending):
+        if 'decision' in entry:
+            log.append(dict(entry, kind='decision', game=memory.get('active_game'), build=memory.get('build')))
+        else:
+            # Legacy complete-task indexes were positions in the pending list; keep them as ids
+            log.append(dict(entry, kind='task', task_id=position))
+            if entry.get('status') == 'completed':
+                log.append({'kind': 'task_update', 'task_id': position, 'status': 'completed'})
+    if pending:
+        log.append({'kind': 'checkpoint', 'reason': 'migration', 'next_task_id': len(pending)})
+    return True
+
+def main():
+    """Query or compact the decision log"""
+    parser = argparse.ArgumentParser(description="Query the append-only decision/task log")
+    parser.add_argument('command', choices=['last', 'since', 'tasks', 'compact'])
+    parser.add_argument('-n', type=int, default=10, help="Records for 'last'")
+    parser.add_argument('--game', default=None)
+    parser.add_argument('--decision', default=None)
+    parser.add_argument('--kind', default=None)
+    parser.add_argument('--build', type=int, default=None)
+    parser.add_argument('--start', default=None, help="ISO timestamp for 'since'")
+    parser.add_argument('--keep', type=int, default=100, help="Decisions kept per game by 'compact'")
+    args = parser.parse_args()
+    
+    log = DecisionLog()
+    if args.command == 'last':
+        filters = {field: getattr(args, field) for field in INDEXED_FIELDS if getattr(args, field) is not None}
+        for record in log.last(args.n, **filters):
+            print(json.dumps(record))
+    elif args.command == 'since':
+        start = datetime.fromisoformat(args.start) if args.start else None
+        for record in log.between(start):
+            print(json.dumps(record))
+    elif args.command == 'tasks':
+        for task in log.pending_tasks():
+            print(f"{task['task_id']}: {task['task']}")
+    else:
+        before, after = log.compact(keep_decisions=args.keep)
+        print(f"[DecisionLog] Compacted {before} records to {after}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Multi-Game Factory Scheduler
+Runs the QA -> FEEL -> StudioBrain loop for many games at once, each in its own workspace
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+from artifact_manifest import changed_artifacts, mark_committed, write_artifact
+from atomic_file import atomic_write
+from git_sync import ARTIFACT_PATHS, GitSyncer
+from memory_sync import DEFAULT_MEMORY, reset_backend
+from orchestrator import build_pipeline, np, publish_results
+
+GAME_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]*$')
+
+def init_workspace(root, game):
+    """Create a game's workspace with its own docs/ and MEMORY.json; returns its absolute path"""
+    workspace = os.path.abspath(os.path.join(root, game))
+    os.makedirs(os.path.join(workspace, 'docs'), exist_ok=True)
+    
+    memory_path = os.path.join(workspace, 'docs', 'MEMORY.json')
+    if not os.path.exists(memory_path):
+        atomic_write(memory_path, json.dumps(dict(DEFAULT_MEMORY, active_game=game), indent=2))
+    return workspace
+
+def run_game_round(workspace, game, params):
+    """Process pool worker: one pipeline pass for one game inside its workspace
+    
+    Every script resolves docs/ relative to the working directory, so switching into the
+    workspace namespaces reports, caches and memory without threading a path through them.
+    """
+    os.chdir(workspace)
+    reset_backend()
+    with open(os.path.join('docs', 'PIPELINE.log'), 'a', encoding='utf-8') as log, \
+            contextlib.redirect_stdout(log):
+        pipeline = build_pipeline(**params)
+        pipeline.run()
+        publish_results(pipeline)
+        reset_backend()
+    
+    bot = pipeline.results['qa']
+    optimizer = pipeline.results['feel']
+    brain = pipeline.results['decision']
+    return {
+        'game': game,
+        'qa_score': bot.calculate_qa_score(),
+        'feel_score': optimizer.feel_score,
+        'weighted_score': brain.weighted_score,
+        'decision': brain.decision,
+        'cached_stages': sorted(pipeline.cached)
+    }
+
+def commit_workspace(workspace, summary):
+    """Commit the game's changed artifacts (runs on a thread; callers serialize git access)"""
+    paths = [os.path.relpath(os.path.join(workspace, path)) for path in ARTIFACT_PATHS]
+    artifacts = changed_artifacts(paths)
+    message = (f"[AUTO][{summary['game']}] FEEL={summary['feel_score']:.2f} "
+               f"QA={summary['qa_score']:.2f} DECISION={summary['decision']}")
+    if not GitSyncer(artifacts).commit(message, artifacts):
+        return False
+    mark_committed(artifacts)
+    return True
+
+class FactoryScheduler:
+    """Runs many games' loops concurrently within a global limit
+    
+    Simulation and scoring are CPU-bound and go to a process pool sized to the limit; the
+    event loop only waits on them and on git, which is serialized because the index is
+    shared by every workspace in the repository.
+    """
+    
+    def __init__(self, games, root='workspaces', max_concurrent=None, rounds=1, commit=False,
+                 pipeline_params=None):
+        for game in games:
+            if not GAME_NAME.match(game):
+                raise ValueError(f"Invalid game name '{game}' (letters, digits, '_', '.' and '-' only)")
+        if len(set(games)) != len(games):
+            raise ValueError("Each game can only be scheduled once")
+        self.games = list(games)
+        self.root = root
+        self.max_concurrent = max_concurrent or os.cpu_count() or 1
+        self.rounds = rounds
+        self.commit = commit
+        self.pipeline_params = pipeline_params or {}
+        self.results = {}
+    
+    def round_params(self, game, round_index):
+        """Pipeline parameters for one pass; seeded runs get a distinct, reproducible seed per game and round
+        
+        The seed is hashed from the game name rather than its position, so adding or reordering
+        games keeps every other game's results (and cached stages) unchanged.
+        """
+        params = dict(self.pipeline_params, workers=1)
+        if params.get('seed') is not None:
+            payload = json.dumps([params['seed'], game, round_index]).encode('utf-8')
+            params['seed'] = int.from_bytes(hashlib.sha256(payload).digest()[:8], 'little') >> 1
+        return params
+    
+    async def run_game(self, game, pool, limit, git_lock):
+        """Every round of one game; a failing round is recorded and ends that game only"""
+        loop = asyncio.get_running_loop()
+        summaries = []
+        for round_index in range(self.rounds):
+            try:
+                workspace = init_workspace(self.root, game)
+                async with limit:
+                    summary = await loop.run_in_executor(pool, run_game_round, workspace, game,
+                                                         self.round_params(game, round_index))
+            except Exception as e:
+                print(f"[Factory] {game} round {round_index + 1}/{self.rounds} failed: {e!r}")
+                summaries.append({'game': game, 'round': round_index + 1, 'error': repr(e)})
+                break
+            summary['round'] = round_index + 1
+            print(f"[Factory] {game} round {round_index + 1}/{self.rounds}: {summary['decision']} "
+                  f"(QA {summary['qa_score']:.3f}, FEEL {summary['feel_score']:.3f})")
+            
+            if self.commit:
+                async with git_lock:
+                    try:
+                        committed = await asyncio.to_thread(commit_workspace, workspace, summary)
+                    except subprocess.CalledProcessError as e:
+                        print(f"[Factory] {game}: git commit failed: {e}")
+                        committed = False
+                summary['committed'] = committed
+            summaries.append(summary)
+        return summaries
+    
+    async def run_async(self):
+        limit = asyncio.Semaphore(self.max_concurrent)
+        git_lock = asyncio.Lock()
+        print(f"[Factory] Running {len(self.games)} games x {self.rounds} rounds, "
+              f"{self.max_concurrent} at a time")
+        with ProcessPoolExecutor(max_workers=self.max_concurrent) as pool:
+            results = await asyncio.gather(*(
+                self.run_game(game, pool, limit, git_lock) for game in self.games
+            ))
+        self.results = dict(zip(self.games, results))
+        return self.results
+    
+    def run(self):
+        return asyncio.run(self.run_async())
+    
+    def save_status(self):
+        """Latest round of every game (or the error that stopped it), for dashboards"""
+        path = os.path.join(self.root, 'FACTORY_STATUS.json')
+        status = {game: summaries[-1] for game, summaries in self.results.items() if summaries}
+        write_artifact(path, json.dumps(status, indent=2, sort_keys=True))
+        print(f"[Factory] Status saved: {path}")
+        return path
+
+def main():
+    """Main function to run the factory loop for several games"""
+    parser = argparse.ArgumentParser(description="Run the QA -> FEEL -> StudioBrain loop for many games")
+    parser.add_argument('games', nargs='+', help="Game names; each gets ROOT/<game>/docs")
+    parser.add_argument('--root', default='workspaces', help="Directory holding the game workspaces")
+    parser.add_argument('--max-concurrent', type=int, default=None,
+                        help="Games simulated at once (default: CPU count)")
+    parser.add_argument('--rounds', type=int, default=1, help="Pipeline passes per game")
+    parser.add_argument('--commit', action='store_true', help="Commit each game's changed artifacts after every round")
+    parser.add_argument('--runs', type=int, default=30, help="Sessions simulated per round")
+    parser.add_argument('--batch', action='store_true', help="Use the NumPy batch engine")
+    parser.add_argument('--gameplay', action='store_true',
+                        help="Play sessions in the headless Stack & Slice simulator (implies --batch)")
+    parser.add_argument('--seed', type=int, default=None, help="Base random seed (mixed with each game name and round)")
+    parser.add_argument('--bootstrap', type=int, default=0, metavar='RESAMPLES',
+                        help="Add FEEL bootstrap confidence intervals")
+    parser.add_argument('--robustness', type=int, default=0, metavar='SCENARIOS',
+                        help="Add a decision-robustness analysis")
+    args = parser.parse_args()
+    
+    if (args.batch or args.gameplay or args.bootstrap or args.robustness) and np is None:
+        print("[Factory] Error: --batch, --gameplay, --bootstrap and --robustness require NumPy (pip install numpy)")
+        return
+    
+    try:
+        scheduler = FactoryScheduler(
+            args.games, root=args.root, max_concurrent=args.max_concurrent, rounds=args.rounds, commit=args.commit,
+            pipeline_params={'runs': args.runs, 'seed': args.seed, 'batch': args.batch, 'gameplay': args.gameplay,
+                             'bootstrap': args.bootstrap, 'robustness': args.robustness}
+        )
+    except ValueError as e:
+        print(f"[Factory] Error: {e}")
+        return
+    
+    scheduler.run()
+    scheduler.save_status()
+    failed = sorted(game for game, summaries in scheduler.results.items() if summaries and 'error' in summaries[-1])
+    if failed:
+        print(f"[Factory] Failed games: {', '.join(failed)} (see FACTORY_STATUS.json)")
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,115 @@ FEEL Optimizer for Stack & Slice
 Reads QA data and calculates FEEL score with tuning recommendations
 """
 
+import argparse
+import hashlib
+import io
 import json
 import csv
-import math
+import os
+import time
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:  # Falls back to typed Python lists without NumPy
+    np = None
+
+from artifact_manifest import write_artifact
+from atomic_file import atomic_write
+from memory_sync import update_memory_fields
+from qa_autoplay_bot import COLUMNAR_SCHEMA, CSV_FIELDNAMES, QAStats, load_columnar_report
+
+FINGERPRINT_BYTES = 4096  # Leading report bytes hashed to detect a rewritten CSV
+BOOTSTRAP_EXACT_LIMIT = 50_000_000  # Resampled row indices (rows x resamples) drawn before the normal approximation
+BOOTSTRAP_CHUNK = 4_000_000  # Resampled row indices held in memory at once
+BOOTSTRAP_FEATURES = ['success', 'perfect', 'session_duration', 'restart_count', 'fail_point', 'perfect_per_min']
+
+class FeelDataset:
+    """Typed QA session columns with aggregates computed in one pass and cached"""
+    
+    def __init__(self, columns=None, base_stats=None):
+        self.columns = columns if columns is not None else {name: [] for name, _ in COLUMNAR_SCHEMA}
+        # Aggregates of sessions scored in earlier runs whose rows are not loaded
+        self.base_stats = base_stats
+        self._stats = None
+    
+    @classmethod
+    def from_records(cls, records):
+        """Build a dataset from already typed session dicts (e.g. simulate_game output)"""
+        columns = {name: [record[name] for record in records] for name, _ in COLUMNAR_SCHEMA}
+        if np is not None:
+            columns = {name: np.array(columns[name], dtype=dtype) for name, dtype in COLUMNAR_SCHEMA}
+        return cls(columns)
+    
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a dataset from QA_Report.csv string rows"""
+        dataset = cls()
+        dataset.extend_rows(rows)
+        return dataset
+    
+    def __len__(self):
+        return len(self.columns['success']) + (self.base_stats.games if self.base_stats else 0)
+    
+    def loaded_rows(self):
+        """Number of sessions whose rows are held in memory"""
+        return len(self.columns['success'])
+    
+    def extend_rows(self, rows):
+        """Append CSV string rows, converting every cell exactly once"""
+        new = {name: [] for name, _ in COLUMNAR_SCHEMA}
+        for row in rows:
+            for name, dtype in COLUMNAR_SCHEMA:
+                if dtype == '|b1':
+                    new[name].append(row[name] == 'True')
+                elif dtype[1] == 'i':
+                    new[name].append(int(row[name]))
+                else:
+                    new[name].append(float(row[name]))
+        
+        for name, dtype in COLUMNAR_SCHEMA:
+            if np is not None:
+                self.columns[name] = np.concatenate([np.asarray(self.columns[name], dtype=dtype),
+                                                     np.array(new[name], dtype=dtype)])
+            else:
+                self.columns[name] = list(self.columns[name]) + new[name]
+        self.invalidate()
+    
+    def invalidate(self):
+        """Drop cached aggregates after the data changed"""
+        self._stats = None
+    
+    def stats(self):
+        """Counts, sums and duration moments over all sessions (cached)"""
+        if self._stats is None:
+            stats = QAStats()
+            if self.base_stats is not None:
+                stats.merge(self.base_stats)
+            if np is not None and self.loaded_rows():
+                stats.add_columns(self.columns)
+            else:
+                names = [name for name, _ in COLUMNAR_SCHEMA]
+                for values in zip(*(self.columns[name] for name in names)):
+                    stats.add(dict(zip(names, values)))
+            self._stats = stats
+        return self._stats
+    
+    def mean(self, name):
+        """Average of a numeric column"""
+        stats = self.stats()
+        return getattr(stats, name) / stats.games
+    
+    def rate(self, name):
+        """Share of sessions where the 'success' or 'perfect' flag is set"""
+        stats = self.stats()
+        flagged = stats.successes if name == 'success' else stats.perfects
+        return flagged / stats.games
+    
+    def duration_std(self):
+        """Population standard deviation of session durations"""
+        return self.stats().duration_moments.std()
+
 class FeelOptimizer:
     def __init__(self):
         # FEEL score weights
@@ -27,32 +131,129 @@ class FeelOptimizer:
             'overwhelming_game': {'juice_duration': -0.20, 'description': 'Reduce juice duration to prevent overwhelm'}
         }
         
-        self.qa_data = []
+        self.dataset = FeelDataset()
+        self.incremental_state = None
+        self.retention_curve = None  # Share of players starting each session (population_sim)
+        self.bootstrap_result = None
         self.feel_score = 0.0
         self.tuning_recommendations = []
     
-    def load_qa_data(self, csv_path='docs/QA_Report.csv'):
-        """Load QA data from CSV report"""
+    def load_qa_data(self, csv_path='docs/QA_Report.csv', columnar_path='docs/QA_Report.cols'):
+        """Load QA data, memory-mapping the columnar report when it is current"""
+        schema_path = os.path.join(columnar_path, 'schema.json')
+        if np is not None and os.path.exists(schema_path):
+            # The columnar report is closed after the CSV, so a stale one is older
+            if not os.path.exists(csv_path) or os.path.getmtime(schema_path) >= os.path.getmtime(csv_path):
+                self.dataset = FeelDataset(load_columnar_report(columnar_path))
+                print(f"[FeelOptimizer] Memory-mapped {len(self.dataset)} QA data points from {columnar_path}")
+                return True
+        
         try:
             with open(csv_path, 'r', encoding='utf-8') as csvfile:
                 reader = csv.DictReader(csvfile)
-                self.qa_data = list(reader)
+                self.dataset = FeelDataset.from_rows(reader)
             
-            print(f"[FeelOptimizer] Loaded {len(self.qa_data)} QA data points")
+            print(f"[FeelOptimizer] Loaded {len(self.dataset)} QA data points")
             return True
         except FileNotFoundError:
             print(f"[FeelOptimizer] Error: QA_Report.csv not found at {csv_path}")
             return False
     
+    def load_qa_data_incremental(self, csv_path='docs/QA_Report.csv', state_path='docs/FEEL_STATE.json'):
+        """Load only the CSV rows appended since the saved state, on top of its aggregates"""
+        if not os.path.exists(csv_path):
+            print(f"[FeelOptimizer] Error: QA_Report.csv not found at {csv_path}")
+            return False
+        
+        with open(csv_path, 'rb') as f:
+            head = f.read(FINGERPRINT_BYTES)
+            if b'\n' not in head:
+                # Empty or still being created: nothing to score and no position worth saving
+                print(f"[FeelOptimizer] Error: {csv_path} has no header row yet")
+                return False
+            header_end = head.index(b'\n') + 1
+            state = self.load_incremental_state(state_path, csv_path, head, header_end)
+            if state is None:
+                # First run or the report was rewritten: rescore from the header on
+                offset = header_end
+                base_stats = QAStats()
+            else:
+                offset = state['offset']
+                base_stats = QAStats.from_dict(state['stats'])
+            
+            f.seek(offset)
+            appended = f.read()
+        
+        # A writer may be mid-chunk; stop at the last complete row
+        appended = appended[:appended.rfind(b'\n') + 1]
+        reader = csv.DictReader(io.StringIO(appended.decode('utf-8'), newline=''), fieldnames=CSV_FIELDNAMES)
+        self.dataset = FeelDataset(base_stats=base_stats)
+        self.dataset.extend_rows(reader)
+        
+        self.incremental_state = {
+            'csv_path': csv_path,
+            'offset': offset + len(appended),
+            'fingerprint': hashlib.sha256(head[:offset + len(appended)]).hexdigest(),
+            'stats': self.dataset.stats().to_dict()
+        }
+        
+        print(f"[FeelOptimizer] Loaded {self.dataset.loaded_rows()} new QA data points "
+              f"({len(self.dataset)} total)")
+        return True
+    
+    def add_live_sessions(self, chunk):
+        """Fold a FeelDataset chunk into the running aggregates without keeping its rows"""
+        stats = QAStats()
+        stats.merge(self.dataset.stats())
+        stats.merge(chunk.stats())
+        self.dataset = FeelDataset(base_stats=stats)
+    
+    def load_retention_curve(self, path='docs/RETENTION.json'):
+        """Load the retention curve written by population_sim"""
+        try:
+            with open(path, 'r') as f:
+                self.retention_curve = json.load(f)['retention']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+            print(f"[FeelOptimizer] Error loading retention curve: {e}")
+            return False
+        
+        print(f"[FeelOptimizer] Loaded retention curve over {len(self.retention_curve)} sessions")
+        return True
+    
+    def load_incremental_state(self, state_path, csv_path, head, header_end):
+        """Return the saved incremental state if it still describes this CSV"""
+        try:
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+            # An offset inside the header would read the header back as a data row
+            if state.get('csv_path') != csv_path or 'stats' not in state:
+                return None
+            if not header_end <= state['offset'] <= os.path.getsize(csv_path):
+                return None
+            if hashlib.sha256(head[:state['offset']]).hexdigest() != state['fingerprint']:
+                return None
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            print(f"[FeelOptimizer] Ignoring unreadable {state_path}: {e!r}")
+            return None
+        return state
+    
+    def save_incremental_state(self, state_path='docs/FEEL_STATE.json'):
+        """Persist the byte offset and aggregates for the next incremental run"""
+        if self.incremental_state is None:
+            return
+        atomic_write(state_path, json.dumps(self.incremental_state, indent=2))
+    
     def calculate_engagement_score(self):
         """Calculate engagement score (0-1)"""
-        if not self.qa_data:
+        if not len(self.dataset):
             return 0.5
         
         # Factors: session duration, success rate, perfect rate
-        avg_duration = sum(float(game['session_duration']) for game in self.qa_data) / len(self.qa_data)
-        success_rate = sum(1 for game in self.qa_data if game['success'] == 'True') / len(self.qa_data)
-        perfect_rate = sum(1 for game in self.qa_data if game['perfect'] == 'True') / len(self.qa_data)
+        avg_duration = self.dataset.mean('session_duration')
+        success_rate = self.dataset.rate('success')
+        perfect_rate = self.dataset.rate('perfect')
         
         # Normalize duration (target: 90-120 seconds)
         duration_score = min(1.0, avg_duration / 120)
@@ -63,11 +264,11 @@ class FeelOptimizer:
     
     def calculate_retention_score(self):
         """Calculate retention score (0-1)"""
-        if not self.qa_data:
+        if not len(self.dataset):
             return 0.5
         
         # Factors: restart rate, session consistency
-        avg_restart_rate = sum(float(game['restart_count']) for game in self.qa_data) / len(self.qa_data)
+        avg_restart_rate = self.dataset.mean('restart_count')
         session_variance = self.calculate_session_variance()
         
         # Lower restart rate = better retention
@@ -76,17 +277,23 @@ class FeelOptimizer:
         # Consistent session lengths = better retention
         consistency_score = max(0.0, 1.0 - session_variance / 60)
         
-        retention = (restart_score * 0.6 + consistency_score * 0.4)
+        if not self.retention_curve or len(self.retention_curve) < 2:
+            retention = (restart_score * 0.6 + consistency_score * 0.4)
+            return min(1.0, retention)
+        
+        # Simulated players returning for later sessions (area under the survival curve)
+        curve_score = sum(self.retention_curve[1:]) / (len(self.retention_curve) - 1)
+        retention = (restart_score * 0.3 + consistency_score * 0.2 + curve_score * 0.5)
         return min(1.0, retention)
     
     def calculate_mastery_score(self):
         """Calculate mastery score (0-1)"""
-        if not self.qa_data:
+        if not len(self.dataset):
             return 0.5
         
         # Factors: perfect rate, fail point progression
-        perfect_rate = sum(1 for game in self.qa_data if game['perfect'] == 'True') / len(self.qa_data)
-        avg_fail_point = sum(float(game['fail_point']) for game in self.qa_data) / len(self.qa_data)
+        perfect_rate = self.dataset.rate('perfect')
+        avg_fail_point = self.dataset.mean('fail_point')
         
         # Perfect rate indicates mastery
         perfect_score = perfect_rate * 2  # Scale up perfect rate importance
@@ -99,12 +306,12 @@ class FeelOptimizer:
     
     def calculate_feedback_density_score(self):
         """Calculate feedback density score (0-1)"""
-        if not self.qa_data:
+        if not len(self.dataset):
             return 0.5
         
         # Factors: perfect per minute, effect frequency
-        avg_perfect_per_min = sum(float(game['perfect_per_min']) for game in self.qa_data) / len(self.qa_data)
-        avg_session_duration = sum(float(game['session_duration']) for game in self.qa_data) / len(self.qa_data)
+        avg_perfect_per_min = self.dataset.mean('perfect_per_min')
+        avg_session_duration = self.dataset.mean('session_duration')
         
         # More perfects per minute = higher feedback density
         perfect_density = min(1.0, avg_perfect_per_min / 2)  # Target: 2 perfects per minute
@@ -122,16 +329,13 @@ class FeelOptimizer:
     
     def calculate_session_variance(self):
         """Calculate variance in session durations"""
-        if len(self.qa_data) < 2:
+        if len(self.dataset) < 2:
             return 0.0
         
-        durations = [float(game['session_duration']) for game in self.qa_data]
-        mean_duration = sum(durations) / len(durations)
-        variance = sum((d - mean_duration) ** 2 for d in durations) / len(durations)
-        return math.sqrt(variance)
+        return self.dataset.duration_std()
     
-    def calculate_feel_score(self):
-        """Calculate overall FEEL score"""
+    def score_feel(self):
+        """Compute the weighted FEEL score without logging"""
         engagement = self.calculate_engagement_score()
         retention = self.calculate_retention_score()
         mastery = self.calculate_mastery_score()
@@ -146,6 +350,118 @@ class FeelOptimizer:
             fps * self.weights['fps']
         )
         
+        return self.feel_score, engagement, retention, mastery, feedback_density, fps
+    
+    def component_scores(self, means):
+        """Vectorized component and FEEL scores from arrays of resampled means (same formulas as calculate_*_score)"""
+        duration = means['session_duration']
+        engagement = np.minimum(1.0, means['success'] * 0.4 + means['perfect'] * 0.3 +
+                                np.minimum(1.0, duration / 120) * 0.3)
+        
+        restart_score = np.maximum(0.0, 1.0 - means['restart_count'] / 2)
+        consistency_score = np.maximum(0.0, 1.0 - means['duration_std'] / 60)
+        if not self.retention_curve or len(self.retention_curve) < 2:
+            retention = np.minimum(1.0, restart_score * 0.6 + consistency_score * 0.4)
+        else:
+            curve_score = sum(self.retention_curve[1:]) / (len(self.retention_curve) - 1)
+            retention = np.minimum(1.0, restart_score * 0.3 + consistency_score * 0.2 + curve_score * 0.5)
+        
+        mastery = np.minimum(1.0, means['perfect'] * 2 * 0.7 + means['fail_point'] * 0.3)
+        feedback_density = np.minimum(1.0, np.minimum(1.0, means['perfect_per_min'] / 2) * 0.6 +
+                                      np.maximum(0.0, 1.0 - duration / 180) * 0.4)
+        fps = np.full_like(engagement, self.calculate_fps_score())
+        
+        scores = {
+            'engagement': engagement,
+            'retention': retention,
+            'mastery': mastery,
+            'feedback_density': feedback_density,
+            'fps': fps
+        }
+        scores['feel'] = sum(scores[name] * weight for name, weight in self.weights.items())
+        return scores
+    
+    def bootstrap_feel(self, resamples=10_000, confidence=0.95, seed=None, method='auto'):
+        """Percentile bootstrap intervals for the FEEL score and its components
+        
+        'exact' resamples row indices in chunks; 'normal' draws the resampled column means from
+        their (asymptotically exact) multivariate normal distribution, which keeps 1M-row reports
+        to a single pass over the data. 'auto' picks exact while rows x resamples stays small.
+        """
+        if np is None:
+            raise RuntimeError("Bootstrap intervals require NumPy (pip install numpy)")
+        
+        rows = self.dataset.loaded_rows()
+        if self.dataset.base_stats is not None or rows < 2:
+            raise ValueError("Bootstrap needs the full report loaded (not an incremental run)")
+        
+        if method == 'auto':
+            method = 'exact' if rows * resamples <= BOOTSTRAP_EXACT_LIMIT else 'normal'
+        
+        rng = np.random.default_rng(seed)
+        columns = {name: self.dataset.columns[name] for name in BOOTSTRAP_FEATURES}
+        if method == 'exact':
+            means = self._bootstrap_exact(columns, rows, resamples, rng)
+        else:
+            means = self._bootstrap_normal(columns, rows, resamples, rng)
+        scores = self.component_scores(means)
+        
+        tail = (1 - confidence) / 2 * 100
+        intervals = {name: tuple(float(v) for v in np.percentile(values, [tail, 100 - tail]))
+                     for name, values in scores.items()}
+        self.bootstrap_result = {
+            'method': method,
+            'resamples': resamples,
+            'confidence': confidence,
+            'intervals': intervals,
+            'feel_std': float(scores['feel'].std())
+        }
+        
+        low, high = intervals['feel']
+        print(f"[FeelOptimizer] FEEL {confidence:.0%} CI: {low:.3f} - {high:.3f} "
+              f"({method} bootstrap, {resamples} resamples)")
+        return self.bootstrap_result
+    
+    def _bootstrap_exact(self, columns, rows, resamples, rng):
+        """Resampled means from explicit index arrays, a chunk of resamples at a time"""
+        means = {name: np.empty(resamples) for name in BOOTSTRAP_FEATURES + ['duration_std']}
+        step = max(1, BOOTSTRAP_CHUNK // rows)
+        for start in range(0, resamples, step):
+            stop = min(start + step, resamples)
+            index = rng.integers(0, rows, (stop - start, rows))
+            for name, values in columns.items():
+                sample = np.asarray(values)[index].astype(float)
+                means[name][start:stop] = sample.mean(axis=1)
+                if name == 'session_duration':
+                    means['duration_std'][start:stop] = sample.std(axis=1)
+        return means
+    
+    def _bootstrap_normal(self, columns, rows, resamples, rng):
+        """Resampled means drawn from N(mean, cov / rows), with duration^2 to recover the std"""
+        width = len(BOOTSTRAP_FEATURES) + 1
+        total = np.zeros(width)
+        cross = np.zeros((width, width))
+        step = max(1, BOOTSTRAP_CHUNK // width)
+        for start in range(0, rows, step):
+            block = [np.asarray(columns[name][start:start + step], dtype=float) for name in BOOTSTRAP_FEATURES]
+            block.append(block[BOOTSTRAP_FEATURES.index('session_duration')] ** 2)
+            block = np.column_stack(block)
+            total += block.sum(axis=0)
+            cross += block.T @ block
+        
+        mean = total / rows
+        covariance = cross / rows - np.outer(mean, mean)
+        draws = rng.multivariate_normal(mean, covariance / rows, size=resamples, method='eigh')
+        
+        means = {name: draws[:, i] for i, name in enumerate(BOOTSTRAP_FEATURES)}
+        duration = means['session_duration']
+        means['duration_std'] = np.sqrt(np.maximum(draws[:, -1] - duration ** 2, 0.0))
+        return means
+    
+    def calculate_feel_score(self):
+        """Calculate overall FEEL score"""
+        _, engagement, retention, mastery, feedback_density, fps = self.score_feel()
+        
         print(f"[FeelOptimizer] FEEL Score: {self.feel_score:.3f}")
         print(f"  - Engagement: {engagement:.3f}")
         print(f"  - Retention: {retention:.3f}")
@@ -211,8 +527,8 @@ class FeelOptimizer:
     
     def apply_tuning_rules(self):
         """Apply specific tuning rules based on game analysis"""
-        avg_session = sum(float(game['session_duration']) for game in self.qa_data) / len(self.qa_data) if self.qa_data else 0
-        success_rate = sum(1 for game in self.qa_data if game['success'] == 'True') / len(self.qa_data) if self.qa_data else 0
+        avg_session = self.dataset.mean('session_duration') if len(self.dataset) else 0
+        success_rate = self.dataset.rate('success') if len(self.dataset) else 0
         
         # Easy game rule
         if success_rate > 0.8:
@@ -244,6 +560,35 @@ class FeelOptimizer:
                 'estimated_impact': 'Less overwhelming experience'
             })
     
+    def generate_retention_summary(self):
+        """Retention curve lines for the FEEL report (empty without a population run)"""
+        if not self.retention_curve:
+            return ''
+        
+        curve = self.retention_curve
+        marks = [session for session in (1, 7, 30) if session < len(curve)] + [len(curve) - 1]
+        points = ', '.join(f"session {session}: {curve[session]:.1%}" for session in sorted(set(marks)))
+        return f"- **Retention Curve**: {points}\n"
+    
+    def generate_bootstrap_summary(self):
+        """Bootstrap interval section for the FEEL report (empty without a bootstrap run)"""
+        if not self.bootstrap_result:
+            return ''
+        
+        result = self.bootstrap_result
+        labels = [('feel', 'FEEL'), ('engagement', 'Engagement'), ('retention', 'Retention'),
+                  ('mastery', 'Mastery'), ('feedback_density', 'Feedback Density')]
+        rows = '\n'.join(f"| {label} | {result['intervals'][name][0]:.3f} | {result['intervals'][name][1]:.3f} |"
+                         for name, label in labels)
+        return f"""
+## Bootstrap Intervals
+{result['confidence']:.0%} percentile intervals, {result['method']} bootstrap with {result['resamples']} resamples
+
+| Score | Lower | Upper |
+|-------|-------|-------|
+{rows}
+"""
+    
     def generate_feel_report(self):
         """Generate FEEL report with tuning recommendations"""
         report_path = 'docs/FEEL_REPORT.md'
@@ -264,7 +609,7 @@ class FeelOptimizer:
 - **Overall FEEL Score**: {self.feel_score:.3f}/1.0
 - **Target**: ≥0.85
 - **Status**: {'PASS' if self.feel_score >= 0.85 else 'FAIL'}
-
+{self.generate_retention_summary()}
 ## Component Scores
 | Component | Score | Weight | Contribution |
 |-----------|-------|--------|--------------|
@@ -273,7 +618,7 @@ class FeelOptimizer:
 | Mastery | {mastery:.3f} | 20% | {mastery * 0.2:.3f} |
 | Feedback Density | {feedback_density:.3f} | 20% | {feedback_density * 0.2:.3f} |
 | FPS | {fps:.3f} | 10% | {fps * 0.1:.3f} |
-
+{self.generate_bootstrap_summary()}
 ## Tuning Recommendations
 
 ### High Priority
@@ -302,43 +647,82 @@ class FeelOptimizer:
 *Generated by FeelOptimizer at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 """
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
-        
-        print(f"[FeelOptimizer] FEEL report generated: {report_path}")
+        if write_artifact(report_path, report_content):
+            print(f"[FeelOptimizer] FEEL report generated: {report_path}")
+        else:
+            print(f"[FeelOptimizer] FEEL report unchanged: {report_path}")
         return report_path
 
 def main():
     """Main function to run FEEL optimization"""
-    import os
+    parser = argparse.ArgumentParser(description="FEEL optimization for Stack & Slice")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Parse only rows appended to QA_Report.csv since the last run")
+    parser.add_argument('--retention', default=None, metavar='PATH',
+                        help="Score retention with a population_sim retention curve (e.g. docs/RETENTION.json)")
+    parser.add_argument('--bootstrap', type=int, default=0, metavar='RESAMPLES',
+                        help="Add bootstrap confidence intervals from RESAMPLES resamples")
+    parser.add_argument('--confidence', type=float, default=0.95, help="Bootstrap interval confidence level")
+    parser.add_argument('--seed', type=int, default=None, help="Bootstrap random seed")
+    parser.add_argument('--watch', type=float, default=None, metavar='SECONDS',
+                        help="Keep rescoring incrementally every SECONDS while the report grows")
+    args = parser.parse_args()
+    
     os.makedirs('docs', exist_ok=True)
     
+    if args.watch is not None:
+        try:
+            while True:
+                run_feel_optimization(incremental=True, retention_path=args.retention)
+                time.sleep(args.watch)
+        except KeyboardInterrupt:
+            print("[FeelOptimizer] Watch stopped")
+        return
+    
+    if args.bootstrap and args.incremental:
+        print("[FeelOptimizer] Error: --bootstrap needs the full report, not --incremental")
+        return
+    if args.bootstrap and np is None:
+        print("[FeelOptimizer] Error: --bootstrap requires NumPy (pip install numpy)")
+        return
+    
+    run_feel_optimization(incremental=args.incremental, retention_path=args.retention,
+                          bootstrap=args.bootstrap, confidence=args.confidence, seed=args.seed)
+
+def run_feel_optimization(incremental=False, retention_path=None, bootstrap=0, confidence=0.95, seed=None):
+    """Score the QA report, write FEEL_REPORT.md and update memory"""
     # Create optimizer
     optimizer = FeelOptimizer()
     
     # Load QA data
-    if not optimizer.load_qa_data():
+    loaded = optimizer.load_qa_data_incremental() if incremental else optimizer.load_qa_data()
+    if not loaded:
         print("[FeelOptimizer] Error: Could not load QA data")
         return
     
+    if retention_path:
+        optimizer.load_retention_curve(retention_path)
+    
     # Calculate FEEL score
     feel_score = optimizer.calculate_feel_score()
-    
+    if bootstrap:
+        optimizer.bootstrap_feel(bootstrap, confidence=confidence, seed=seed)
+    save_feel_results(optimizer, feel_score)
+
+def save_feel_results(optimizer, feel_score):
+    """Write FEEL_REPORT.md and record the FEEL score in MEMORY.json"""
     # Generate report
     optimizer.generate_feel_report()
     
     # Update memory
-    memory_path = 'docs/MEMORY.json'
-    try:
-        with open(memory_path, 'r') as f:
-            memory = json.load(f)
-    except FileNotFoundError:
-        memory = {"active_game": None, "build": 0, "last_qa": 0, "last_feel": 0, "pending": []}
-    
-    memory["last_feel"] = feel_score
+    if optimizer.bootstrap_result:
+        update_memory_fields({"last_feel": feel_score,
+                              "last_feel_ci": list(optimizer.bootstrap_result['intervals']['feel'])})
+    else:
+        update_memory_fields({"last_feel": feel_score}, remove=["last_feel_ci"])
     
-    with open(memory_path, 'w') as f:
-        json.dump(memory, f, indent=2)
+    # Saved last so an interrupted run is simply redone next time
+    optimizer.save_incremental_state()
     
     print(f"[FeelOptimizer] FEEL optimization complete. Score: {feel_score:.3f}")
 
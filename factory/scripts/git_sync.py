@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Git Sync for the AI Game Factory
+Commits an explicit set of generated paths, batching many updates into one commit
+"""
+
+import os
+import subprocess
+import time
+
+from atomic_file import file_stamp
+
+MEMORY_PATHS = ['docs/MEMORY.json', 'docs/DECISION_LOG.jsonl']
+ARTIFACT_PATHS = MEMORY_PATHS + [
+    'docs/QA.md', 'docs/QA_Report.csv', 'docs/FEEL_REPORT.md', 'docs/STUDIO_DECISION.md',
+    'docs/RETENTION.json', 'docs/SWEEP.csv', 'docs/DECISIONS.csv', 'docs/AB_COMPARE.md', 'docs/RARE_EVENTS.md'
+]
+
+class GitSyncer:
+    """Stages and commits only the given paths, never the whole working tree
+    
+    Changes are detected from file stamps (inode, mtime, size) without running git, and
+    committed once `max_changes` updates have been seen or `window` seconds have passed
+    since the first one, so a commit costs one `git add` and one `git commit` however many
+    writes it covers and whatever the size of the rest of the repository.
+    """
+    
+    def __init__(self, paths, window=60.0, max_changes=20):
+        self.paths = list(paths)
+        self.window = window
+        self.max_changes = max_changes
+        self._stamps = {path: file_stamp(path) for path in self.paths}
+        self.dirty = set()
+        self.changes = 0
+        self._first_change = None
+    
+    def poll(self):
+        """Note paths whose files changed since the last poll; returns how many"""
+        changed = 0
+        for path in self.paths:
+            stamp = file_stamp(path)
+            if stamp != self._stamps[path]:
+                self._stamps[path] = stamp
+                self.dirty.add(path)
+                changed += 1
+        if changed:
+            self.changes += changed
+            if self._first_change is None:
+                self._first_change = time.monotonic()
+        return changed
+    
+    def due(self):
+        """Whether the batching window or change count has been reached"""
+        if not self.dirty:
+            return False
+        return self.changes >= self.max_changes or time.monotonic() - self._first_change >= self.window
+    
+    def commit(self, message, paths):
+        """Stage and commit exactly `paths`; returns True if a commit was made"""
+        paths = sorted(path for path in set(paths) if os.path.exists(path))
+        if not paths:
+            return False
+        subprocess.run(["git", "add", "--"] + paths, check=True)
+        # A pathspec keeps anything else that happens to be staged out of this commit
+        result = subprocess.run(["git", "commit", "-q", "-m", message, "--"] + paths,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            # Files rewritten with the content HEAD already has leave nothing to commit
+            if subprocess.run(["git", "diff", "--cached", "--quiet", "HEAD", "--"] + paths).returncode != 0:
+                raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+        
+        self.dirty.clear()
+        self.changes = 0
+        self._first_change = None
+        for path in paths:
+            self._stamps[path] = file_stamp(path)
+        return result.returncode == 0
+    
+    def flush(self, message):
+        """Commit the paths seen changing since the last commit"""
+        self.poll()
+        if not self.dirty:
+            return False
+        return self.commit(message, self.dirty)
+    
+    def changed_paths(self):
+        """Paths git reports as modified or untracked, checking only the configured set"""
+        result = subprocess.run(["git", "ls-files", "-z", "--modified", "--others", "--exclude-standard", "--"] + self.paths,
+                                capture_output=True, text=True, check=True)
+        return [path for path in result.stdout.split('\0') if path]
+    
+    def sync(self, message):
+        """One-shot: commit whatever differs from HEAD among the paths"""
+        return self.commit(message, self.changed_paths())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Live QA -> FEEL Pipeline for Stack & Slice
+Runs the autoplay bot and the FEEL optimizer concurrently over a bounded queue
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import time
+
+from qa_autoplay_bot import (
+    COLUMNAR_SCHEMA, QAAutoplayBot, QAReportWriter, QAStats, np, save_qa_results
+)
+from feel_optimizer import FeelDataset, FeelOptimizer, save_feel_results
+
+class QueueReportSink:
+    """Report writer that pushes session chunks onto a bounded queue"""
+    
+    def __init__(self, session_queue, chunk_size=10_000):
+        self.session_queue = session_queue
+        self.chunk_size = chunk_size
+        self.buffer = []
+    
+    def open(self, resume=False):
+        """Live consumers start from the current run; nothing to resume"""
+        return 0
+    
+    def truncate_rows(self, rows):
+        """Rows already queued cannot be taken back"""
+    
+    def load_stats(self):
+        """A queue keeps no rows to rebuild stats from"""
+        return QAStats()
+    
+    def write_row(self, game_data):
+        """Buffer one session record, pushing it when the chunk is full"""
+        self.buffer.append({name: game_data[name] for name, _ in COLUMNAR_SCHEMA})
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+    
+    def write_columns(self, columns, timestamp):
+        """Push a batch of column arrays in chunk_size slices"""
+        self.flush()
+        for start in range(0, len(columns['success']), self.chunk_size):
+            chunk = {name: columns[name][start:start + self.chunk_size] for name, _ in COLUMNAR_SCHEMA}
+            # put() blocks while the queue is full, throttling the producer
+            self.session_queue.put(('columns', chunk))
+    
+    def flush(self):
+        """Push buffered records"""
+        if self.buffer:
+            self.session_queue.put(('records', self.buffer))
+            self.buffer = []
+    
+    def close(self):
+        """Push remaining records and signal the end of the run"""
+        self.flush()
+        self.session_queue.put(('done', None))
+
+def _produce(session_queue, runs, batch, seed, workers, chunk_size):
+    """Producer process: run the autoplay bot and stream sessions to the queue"""
+    bot = QAAutoplayBot(seed=seed)
+    bot.simulation_runs = runs
+    bot.store_sessions = False
+    # Batch runs emit columns once per shard; shards of one chunk keep the live score moving
+    bot.shard_size = chunk_size
+    
+    writers = [QAReportWriter(chunk_size=chunk_size), QueueReportSink(session_queue, chunk_size)]
+    bot.attach_report_writers(writers)
+    try:
+        if batch:
+            bot.run_batch_simulation(seed=seed, workers=workers)
+        else:
+            bot.run_simulation()
+    finally:
+        for writer in writers:
+            writer.close()
+    
+    save_qa_results(bot)
+
+def run_live_pipeline(runs, batch=False, seed=None, workers=1, queue_size=8,
+                      chunk_size=10_000, report_interval=1.0):
+    """Run QA and FEEL concurrently, keeping a live FEEL score as sessions arrive"""
+    session_queue = multiprocessing.Queue(maxsize=queue_size)
+    producer = multiprocessing.Process(
+        target=_produce, args=(session_queue, runs, batch, seed, workers, chunk_size)
+    )
+    producer.start()
+    
+    optimizer = FeelOptimizer()
+    last_report = time.monotonic()
+    finished = False
+    try:
+        while not finished:
+            try:
+                kind, payload = session_queue.get(timeout=1.0)
+            except queue.Empty:
+                if not producer.is_alive():
+                    print("[LivePipeline] Error: autoplay producer exited before finishing")
+                    return None
+                continue
+            
+            if kind == 'done':
+                finished = True
+                continue
+            
+            chunk = FeelDataset.from_records(payload) if kind == 'records' else FeelDataset(payload)
+            optimizer.add_live_sessions(chunk)
+            
+            if time.monotonic() - last_report >= report_interval:
+                feel_score = optimizer.score_feel()[0]
+                print(f"[LivePipeline] {len(optimizer.dataset)} sessions, live FEEL Score: {feel_score:.3f}")
+                last_report = time.monotonic()
+    finally:
+        # A finished producer is still saving the QA results; on any other exit it is stopped
+        if not finished and producer.is_alive():
+            producer.terminate()
+        producer.join()
+    
+    if producer.exitcode != 0:
+        print(f"[LivePipeline] Error: autoplay producer failed (exit code {producer.exitcode})")
+        return None
+    
+    feel_score = optimizer.calculate_feel_score()
+    save_feel_results(optimizer, feel_score)
+    return feel_score
+
+def main():
+    """Main function to run the live QA -> FEEL pipeline"""
+    parser = argparse.ArgumentParser(description="Live QA -> FEEL pipeline for Stack & Slice")
+    parser.add_argument('--runs', type=int, default=30, help="Number of sessions to simulate")
+    parser.add_argument('--batch', action='store_true', help="Use the NumPy batch engine")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible runs")
+    parser.add_argument('--workers', type=int, default=1, help="Process pool size for --batch runs")
+    parser.add_argument('--queue-size', type=int, default=8,
+                        help="Chunks buffered between the stages before the bot blocks")
+    parser.add_argument('--chunk-size', type=int, default=10_000, help="Sessions per queued chunk")
+    args = parser.parse_args()
+    
+    if args.batch and np is None:
+        print("[LivePipeline] Error: --batch requires NumPy (pip install numpy)")
+        return
+    
+    os.makedirs('docs', exist_ok=True)
+    run_live_pipeline(args.runs, batch=args.batch, seed=args.seed, workers=args.workers,
+                      queue_size=args.queue_size, chunk_size=args.chunk_size)
+
+if __name__ == "__main__":
+    main()
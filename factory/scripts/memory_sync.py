@@ -1,70 +1,476 @@
 #!/usr/bin/env python3
 """
 Memory Sync Script - docs/MEMORY.json içeriğini CI'de commit eden iskelet
+Storage is pluggable: MEMORY.json + decision log (default) or SQLite (FACTORY_MEMORY_BACKEND=sqlite)
 """
 
+import atexit
 import json
+import os
+import random
+import shlex
+import signal
+import sqlite3
 import subprocess
 import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
+from atomic_file import atomic_write, file_lock, file_stamp, read_bytes
+from decision_log import DecisionLog, migrate_pending
+from git_sync import ARTIFACT_PATHS, MEMORY_PATHS, GitSyncer
+
+MEMORY_PATH = 'docs/MEMORY.json'
+MEMORY_DB_PATH = 'docs/memory.db'
+DEFAULT_MEMORY = {"active_game": None, "build": 0, "last_qa": 0, "last_feel": 0}
+
+class JsonMemoryBackend:
+    """Summary fields in MEMORY.json, tasks and decisions in the append-only decision log"""
+    
+    def __init__(self, memory_path=MEMORY_PATH):
+        self.memory_path = memory_path
+        self.log = DecisionLog()
+    
+    def exists(self):
+        return os.path.exists(self.memory_path)
+    
+    def version(self):
+        """Change stamp of MEMORY.json and the decision log, for caches"""
+        return file_stamp(self.memory_path), file_stamp(self.log.log_path)
+    
+    def _parse(self, raw):
+        return json.loads(raw) if raw is not None else dict(DEFAULT_MEMORY)
+    
+    def _write(self, memory):
+        atomic_write(self.memory_path, json.dumps(memory, indent=2))
+    
+    def load(self):
+        """Summary fields as a dict"""
+        memory = self._parse(read_bytes(self.memory_path))
+        if 'pending' in memory:
+            # Tasks and decisions live in the decision log; move a legacy list there once
+            with file_lock(self.memory_path):
+                memory = self._parse(read_bytes(self.memory_path))
+                if migrate_pending(memory, self.log):
+                    self._write(memory)
+        return memory
+    
+    def save(self, memory):
+        """Replace every summary field (last writer wins; prefer update for read-modify-write)"""
+        with file_lock(self.memory_path):
+            self._write(memory)
+    
+    def update(self, mutator, retries=50):
+        """Apply mutator(memory) atomically and return the stored result
+        
+        The mutator runs on a snapshot without holding the lock and may run more than once,
+        so it should only modify the dict. The write lands only if the file still holds the
+        bytes that were read (compare-and-swap); otherwise it retries on a fresh snapshot.
+        Comparing contents also catches writers that bypass the lock, like git checkouts.
+        """
+        for attempt in range(retries):
+            raw = read_bytes(self.memory_path)
+            memory = self._parse(raw)
+            if 'pending' in memory:
+                self.load()
+                continue
+            mutator(memory)
+            with file_lock(self.memory_path):
+                if read_bytes(self.memory_path) == raw:
+                    self._write(memory)
+                    return memory
+            time.sleep(random.uniform(0, 0.001 * (attempt + 1)))
+        raise RuntimeError(f"Gave up updating {self.memory_path} after {retries} conflicting writes")
+    
+    def update_fields(self, fields, remove=()):
+        """Set (and remove) summary fields"""
+        def apply(memory):
+            memory.update(fields)
+            for field in remove:
+                memory.pop(field, None)
+        return self.update(apply)
+    
+    def add_task(self, task, game=None):
+        return self.log.add_task(task, game=game)
+    
+    def add_tasks(self, tasks, game=None):
+        return self.log.add_tasks(tasks, game=game)
+    
+    def complete_task(self, task_id):
+        return self.log.complete_task(task_id)
+    
+    def complete_tasks(self, task_ids):
+        return self.log.complete_tasks(task_ids)
+    
+    def pending_tasks(self):
+        return self.log.pending_tasks()
+    
+    def record_decision(self, entry):
+        self.log.append(dict(entry, kind='decision'))
+    
+    def last_decisions(self, n=10, game=None):
+        filters = {'game': game} if game is not None else {}
+        return self.log.last(n, kind='decision', **filters)
+    
+    def close(self):
+        """Nothing is held open between calls"""
+    
+    def export(self, memory_path=MEMORY_PATH):
+        """MEMORY.json already is the store; copy it when exporting elsewhere"""
+        if memory_path != self.memory_path:
+            atomic_write(memory_path, json.dumps(self.load(), indent=2))
+        return memory_path
+
+class SqliteMemoryBackend:
+    """Fields, tasks and decisions as rows of a local SQLite database in WAL mode"""
+    
+    def __init__(self, db_path=MEMORY_DB_PATH, memory_path=MEMORY_PATH):
+        self.db_path = db_path
+        self.memory_path = memory_path
+        # Autocommit mode; multi-statement writes use explicit transactions
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS fields (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY,
+                task TEXT NOT NULL,
+                game TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                timestamp TEXT NOT NULL,
+                completed_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status);
+            CREATE TABLE IF NOT EXISTS decisions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                game TEXT,
+                build INTEGER,
+                decision TEXT NOT NULL,
+                weighted_score REAL,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS decisions_game ON decisions (game, id);
+            CREATE INDEX IF NOT EXISTS decisions_decision ON decisions (decision, id);
+        """)
+        if not self.exists():
+            self.import_json()
+    
+    @contextmanager
+    def transaction(self):
+        """One write transaction, taken up front so concurrent writers queue instead of deadlocking"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+    
+    def exists(self):
+        return self.conn.execute("SELECT 1 FROM fields LIMIT 1").fetchone() is not None
+    
+    def version(self):
+        """Changes when another connection commits; this connection's own writes do not bump it"""
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    def import_json(self):
+        """Seed an empty database from MEMORY.json and the decision log; returns True if it seeded"""
+        json_backend = JsonMemoryBackend(self.memory_path)
+        with self.transaction():
+            # Rechecked under the write lock: of several processes opening a new database, only the first seeds it
+            if self.exists():
+                return False
+            memory = json_backend.load() if json_backend.exists() else dict(DEFAULT_MEMORY)
+            self.conn.executemany("INSERT OR REPLACE INTO fields VALUES (?, ?)",
+                                  [(name, json.dumps(value)) for name, value in memory.items()])
+            for task in json_backend.log.tasks():
+                self.conn.execute("INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?)",
+                                  (task['task_id'], task['task'], task.get('game'), task['status'],
+                                   task['timestamp'], task.get('completed_at')))
+            for entry in json_backend.log.last(json_backend.log.count('kind', 'decision'), kind='decision'):
+                self._insert_decision(entry)
+        return True
+    
+    def load(self):
+        memory = dict(DEFAULT_MEMORY)
+        memory.update({name: json.loads(value) for name, value in self.conn.execute("SELECT name, value FROM fields")})
+        return memory
+    
+    def save(self, memory):
+        """Replace every summary field"""
+        with self.transaction():
+            self.conn.execute("DELETE FROM fields")
+            self.conn.executemany("INSERT INTO fields VALUES (?, ?)",
+                                  [(name, json.dumps(value)) for name, value in memory.items()])
+    
+    def update(self, mutator):
+        """Apply mutator(memory) inside one write transaction and store the changed fields"""
+        with self.transaction():
+            before = self.load()
+            memory = dict(before)
+            mutator(memory)
+            self.conn.executemany("INSERT OR REPLACE INTO fields VALUES (?, ?)",
+                                  [(name, json.dumps(value)) for name, value in memory.items()
+                                   if name not in before or before[name] != value])
+            self.conn.executemany("DELETE FROM fields WHERE name = ?", [(name,) for name in before if name not in memory])
+        return memory
+    
+    def update_fields(self, fields, remove=()):
+        """Set (and remove) summary fields; one row per field"""
+        with self.transaction():
+            self.conn.executemany("INSERT OR REPLACE INTO fields VALUES (?, ?)",
+                                  [(name, json.dumps(value)) for name, value in fields.items()])
+            self.conn.executemany("DELETE FROM fields WHERE name = ?", [(name,) for name in remove])
+        return self.load()
+    
+    def add_task(self, task, game=None):
+        cursor = self.conn.execute("INSERT INTO tasks (task, game, timestamp) VALUES (?, ?, ?)",
+                                   (task, game, datetime.now().isoformat()))
+        return cursor.lastrowid
+    
+    def add_tasks(self, tasks, game=None):
+        now = datetime.now().isoformat()
+        with self.transaction():
+            ids = [self.conn.execute("INSERT INTO tasks (task, game, timestamp) VALUES (?, ?, ?)",
+                                     (task, game, now)).lastrowid for task in tasks]
+        return ids
+    
+    def complete_task(self, task_id):
+        cursor = self.conn.execute("UPDATE tasks SET status = 'completed', completed_at = ? WHERE id = ?",
+                                   (datetime.now().isoformat(), task_id))
+        return cursor.rowcount == 1
+    
+    def complete_tasks(self, task_ids):
+        now = datetime.now().isoformat()
+        with self.transaction():
+            done = [task_id for task_id in task_ids
+                    if self.conn.execute("UPDATE tasks SET status = 'completed', completed_at = ? WHERE id = ?",
+                                         (now, task_id)).rowcount == 1]
+        return done
+    
+    def pending_tasks(self):
+        rows = self.conn.execute("SELECT id, task, game, timestamp FROM tasks WHERE status = 'pending' ORDER BY id")
+        return [{'task_id': row[0], 'task': row[1], 'game': row[2], 'timestamp': row[3], 'status': 'pending'}
+                for row in rows]
+    
+    def _insert_decision(self, entry):
+        entry = dict(entry)
+        entry.setdefault('timestamp', datetime.now().isoformat())
+        self.conn.execute(
+            "INSERT INTO decisions (timestamp, game, build, decision, weighted_score, payload) VALUES (?, ?, ?, ?, ?, ?)",
+            (entry['timestamp'], entry.get('game'), entry.get('build'), entry['decision'],
+             entry.get('weighted_score'), json.dumps(entry))
+        )
+    
+    def record_decision(self, entry):
+        self._insert_decision(entry)
+    
+    def last_decisions(self, n=10, game=None):
+        if game is None:
+            rows = self.conn.execute("SELECT payload FROM decisions ORDER BY id DESC LIMIT ?", (n,))
+        else:
+            rows = self.conn.execute("SELECT payload FROM decisions WHERE game = ? ORDER BY id DESC LIMIT ?",
+                                     (game, n))
+        return [json.loads(payload) for (payload,) in rows][::-1]
+    
+    def close(self):
+        self.conn.close()
+    
+    def export(self, memory_path=MEMORY_PATH):
+        """Write the summary fields to MEMORY.json for git"""
+        with file_lock(memory_path):
+            atomic_write(memory_path, json.dumps(self.load(), indent=2))
+        return memory_path
+
+_backend = None
+
+def get_backend():
+    """The configured memory backend (FACTORY_MEMORY_BACKEND=json|sqlite), created once per process"""
+    global _backend
+    if _backend is None:
+        kind = os.environ.get('FACTORY_MEMORY_BACKEND', 'json')
+        if kind == 'sqlite':
+            _backend = SqliteMemoryBackend()
+        elif kind == 'json':
+            _backend = JsonMemoryBackend()
+        else:
+            raise ValueError(f"Unknown FACTORY_MEMORY_BACKEND '{kind}' (expected json or sqlite)")
+    return _backend
+
+class MemoryClient:
+    """In-process view of memory that queues writes and flushes them in one go
+    
+    Reads come from the cached state while the backend's change stamp (file identity, mtime
+    and size, or SQLite's data_version) is unchanged, so other processes' writes are picked up
+    on the next read. Mutations are queued as deltas and applied by commit(), at the end of a
+    with-block or (for the process-wide client) at interpreter exit, each kind in a single write.
+    """
+    
+    def __init__(self, backend=None):
+        self.backend = backend or get_backend()
+        self._version = None
+        self._memory = None
+        self._pending = None
+        self._fields = {}
+        self._removed = set()
+        self._new_tasks = []
+        self._completed = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+    
+    def _refresh(self):
+        version = self.backend.version()
+        if self._memory is None or version != self._version:
+            self._version = version
+            self._memory = self.backend.load()
+            self._pending = {task['task_id']: task for task in self.backend.pending_tasks()}
+    
+    def load(self):
+        """Summary fields including queued changes"""
+        self._refresh()
+        memory = dict(self._memory)
+        memory.update(self._fields)
+        for field in self._removed:
+            memory.pop(field, None)
+        return memory
+    
+    def pending_tasks(self):
+        """Pending tasks, less the ones queued for completion (queued additions have no id yet)"""
+        self._refresh()
+        completed = set(self._completed)
+        return [task for task_id, task in sorted(self._pending.items()) if task_id not in completed]
+    
+    def update_fields(self, fields, remove=()):
+        for field in remove:
+            self._fields.pop(field, None)
+            self._removed.add(field)
+        for field, value in fields.items():
+            self._fields[field] = value
+            self._removed.discard(field)
+    
+    def update_field(self, field, value):
+        self.update_fields({field: value})
+    
+    def add_task(self, task):
+        """Queue a task; its id is assigned by commit()"""
+        self._new_tasks.append(task)
+    
+    def complete_task(self, task_id):
+        """Queue a completion; False if no such pending task"""
+        self._refresh()
+        if task_id not in self._pending or task_id in self._completed:
+            return False
+        self._completed.append(task_id)
+        return True
+    
+    def dirty(self):
+        return bool(self._fields or self._removed or self._new_tasks or self._completed)
+    
+    def commit(self):
+        """Flush queued changes; returns (task_id, task) for the tasks added"""
+        if not self.dirty():
+            return []
+        added = []
+        if self._fields or self._removed:
+            self.backend.update_fields(self._fields, self._removed)
+        if self._new_tasks:
+            game = self.load().get("active_game")
+            added = list(zip(self.backend.add_tasks(self._new_tasks, game=game), self._new_tasks))
+        if self._completed:
+            self.backend.complete_tasks(self._completed)
+        
+        self._fields, self._removed, self._new_tasks, self._completed = {}, set(), [], []
+        # Own writes do not always move the stamp (SQLite data_version), so reload next time
+        self._memory = None
+        return added
+
+_client = None
+
+def get_client():
+    """Process-wide MemoryClient over the configured backend"""
+    global _client
+    if _client is None:
+        _client = MemoryClient()
+    return _client
+
+@atexit.register
+def _commit_client():
+    """Flush whatever the process-wide client still has queued; other clients commit explicitly"""
+    # Like MemoryClient.__exit__, a run that died on an uncaught exception leaves memory untouched
+    # rather than half-applied (the interpreter sets sys.last_value before exit hooks run)
+    if _client is not None and getattr(sys, 'last_value', None) is None:
+        _client.commit()
+
+def reset_backend():
+    """Flush and drop the process-wide backend and client, e.g. before switching to another game's workspace"""
+    global _backend, _client
+    if _client is not None:
+        _client.commit()
+    if _backend is not None:
+        _backend.close()
+    _backend = None
+    _client = None
+
+def memory_exists():
+    """Whether any memory has been stored yet"""
+    return get_backend().exists()
+
 def load_memory():
-    """Load memory configuration from docs/MEMORY.json"""
-    try:
-        with open('docs/MEMORY.json', 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"active_game": None, "build": 0, "last_qa": 0, "last_feel": 0, "pending": []}
+    """Load memory summary fields"""
+    return get_backend().load()
 
 def save_memory(memory):
-    """Save memory configuration to docs/MEMORY.json"""
-    with open('docs/MEMORY.json', 'w') as f:
-        json.dump(memory, f, indent=2)
+    """Replace memory summary fields"""
+    get_backend().save(memory)
+
+def update_memory(mutator):
+    """Atomic read-modify-write: mutator(memory) edits the dict in place and may be retried"""
+    return get_backend().update(mutator)
 
 def update_memory_field(field, value):
     """Update a specific field in memory"""
-    memory = load_memory()
-    memory[field] = value
-    save_memory(memory)
-    return memory
+    return get_backend().update_fields({field: value})
+
+def update_memory_fields(fields, remove=()):
+    """Update several fields (and remove others) in one write"""
+    return get_backend().update_fields(fields, remove)
 
 def add_pending_task(task):
-    """Add a task to pending list"""
-    memory = load_memory()
-    if "pending" not in memory:
-        memory["pending"] = []
-    memory["pending"].append({
-        "task": task,
-        "timestamp": datetime.now().isoformat(),
-        "status": "pending"
-    })
-    save_memory(memory)
-    return memory
+    """Add a pending task; returns its task id"""
+    backend = get_backend()
+    return backend.add_task(task, game=backend.load().get("active_game"))
 
 def complete_pending_task(task_index):
     """Mark a pending task as completed"""
-    memory = load_memory()
-    if "pending" in memory and 0 <= task_index < len(memory["pending"]):
-        memory["pending"][task_index]["status"] = "completed"
-        memory["pending"][task_index]["completed_at"] = datetime.now().isoformat()
-        save_memory(memory)
-    return memory
+    return get_backend().complete_task(task_index)
+
+def record_decision(entry):
+    """Append a StudioBrain decision to the history"""
+    get_backend().record_decision(entry)
+
+def export_memory():
+    """Produce docs/MEMORY.json from the active backend"""
+    return get_backend().export()
 
 def sync_to_git():
     """Sync memory changes to git"""
     try:
-        # Check if there are changes
-        result = subprocess.run(["git", "diff", "--quiet", "docs/MEMORY.json"], 
-                              capture_output=True)
-        if result.returncode == 0:
+        export_memory()
+        if not GitSyncer(MEMORY_PATHS).sync(f"[MEMORY] Updated at {datetime.now().isoformat()}"):
             print("No changes to sync")
             return True
         
-        # Add and commit changes
-        subprocess.run(["git", "add", "docs/MEMORY.json"], check=True)
-        subprocess.run(["git", "commit", "-m", f"[MEMORY] Updated at {datetime.now().isoformat()}"], 
-                      check=True)
-        
         print("Memory synced to git")
         return True
         
@@ -72,57 +478,128 @@ def sync_to_git():
         print(f"Git sync failed: {e}")
         return False
 
-def get_memory_status():
+def run_sync_daemon(window=60.0, max_changes=20, poll_interval=1.0):
+    """Merge memory and report updates into one commit per window (or per max_changes updates)"""
+    backend = get_backend()
+    syncer = GitSyncer(ARTIFACT_PATHS, window, max_changes)
+    # SIGTERM exits through the finally block so the last batch is not lost
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    version = None
+    print(f"[MEMORY] Sync daemon watching {len(syncer.paths)} paths (window {window:g}s, {max_changes} changes)")
+    
+    def flush():
+        changes = syncer.changes
+        if syncer.flush(f"[MEMORY] Synced {changes} updates at {datetime.now().isoformat()}"):
+            print(f"[MEMORY] Committed {changes} updates")
+    
+    try:
+        while True:
+            # The SQLite backend only reaches git through an exported MEMORY.json
+            if backend.version() != version:
+                version = backend.version()
+                export_memory()
+            syncer.poll()
+            if syncer.due():
+                flush()
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        export_memory()
+        flush()
+
+def get_memory_status(client=None):
     """Get current memory status"""
-    memory = load_memory()
+    client = client or get_client()
+    memory = client.load()
     return {
         "active_game": memory.get("active_game"),
         "build": memory.get("build", 0),
         "last_qa": memory.get("last_qa", 0),
         "last_feel": memory.get("last_feel", 0),
-        "pending_tasks": len(memory.get("pending", []))
+        "last_decision": memory.get("last_decision"),
+        "pending_tasks": len(client.pending_tasks())
     }
 
+def flush_client(client):
+    """Commit queued CLI changes and report the ids given to new tasks"""
+    for task_id, task in client.commit():
+        print(f"Added task {task_id}: {task}")
+
+def run_command(client, args):
+    """Apply one CLI command through the client; returns False on bad input"""
+    command = args[0] if args else ""
+    
+    if command == "status":
+        status = get_memory_status(client)
+        print(json.dumps(status, indent=2))
+    
+    elif command == "update" and len(args) >= 3 and len(args) % 2 == 1:
+        for field, value in zip(args[1::2], args[2::2]):
+            client.update_field(field, value)
+            print(f"Updated {field} to {value}")
+    
+    elif command == "add-task" and len(args) >= 2:
+        client.add_task(" ".join(args[1:]))
+    
+    elif command == "complete-task" and len(args) >= 2:
+        invalid = [arg for arg in args[1:] if not arg.lstrip('-').isdigit()]
+        if invalid:
+            print(f"Invalid task index: {', '.join(invalid)}")
+            return False
+        ok = True
+        for task_index in map(int, args[1:]):
+            if client.complete_task(task_index):
+                print(f"Completed task at index {task_index}")
+            else:
+                print(f"No task at index {task_index}")
+                ok = False
+        return ok
+    
+    elif command == "export":
+        flush_client(client)
+        print(f"Exported {export_memory()}")
+    
+    elif command == "sync":
+        flush_client(client)
+        return sync_to_git()
+    
+    elif command == "sync-daemon" and len(args) <= 3:
+        flush_client(client)
+        window = float(args[1]) if len(args) > 1 else 60.0
+        max_changes = int(args[2]) if len(args) > 2 else 20
+        run_sync_daemon(window, max_changes)
+    
+    else:
+        print(f"Invalid command or arguments: {' '.join(args)}")
+        return False
+    return True
+
 def main():
     """Main function for CLI usage"""
     if len(sys.argv) < 2:
         print("Usage: python memory_sync.py [command] [args...]")
         print("Commands:")
         print("  status - Show current memory status")
-        print("  update <field> <value> - Update a field")
+        print("  update <field> <value> [<field> <value> ...] - Update fields")
         print("  add-task <task> - Add pending task")
-        print("  complete-task <index> - Complete pending task")
+        print("  complete-task <index> [<index> ...] - Complete pending tasks")
+        print("  export - Write docs/MEMORY.json from the active backend")
         print("  sync - Sync to git")
+        print("  sync-daemon [window_seconds] [max_changes] - Batch memory and report updates into periodic commits")
+        print("  batch - Run commands read from stdin, one per line, with a single write")
+        print("Set FACTORY_MEMORY_BACKEND=sqlite to use docs/memory.db")
         return
     
-    command = sys.argv[1]
-    
-    if command == "status":
-        status = get_memory_status()
-        print(json.dumps(status, indent=2))
-    
-    elif command == "update" and len(sys.argv) >= 4:
-        field = sys.argv[2]
-        value = sys.argv[3]
-        update_memory_field(field, value)
-        print(f"Updated {field} to {value}")
-    
-    elif command == "add-task" and len(sys.argv) >= 3:
-        task = " ".join(sys.argv[2:])
-        add_pending_task(task)
-        print(f"Added task: {task}")
-    
-    elif command == "complete-task" and len(sys.argv) >= 3:
-        task_index = int(sys.argv[2])
-        complete_pending_task(task_index)
-        print(f"Completed task at index {task_index}")
-    
-    elif command == "sync":
-        success = sync_to_git()
-        sys.exit(0 if success else 1)
-    
+    client = get_client()
+    if sys.argv[1] == "batch":
+        commands = [shlex.split(line) for line in sys.stdin if line.strip() and not line.lstrip().startswith('#')]
     else:
-        print("Invalid command or arguments")
+        commands = [sys.argv[1:]]
+    
+    results = [run_command(client, args) for args in commands]
+    flush_client(client)
+    if not all(results):
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Pipeline Orchestrator for Stack & Slice
+Runs QA -> FEEL -> StudioBrain as a dependency graph in one process with per-stage result caching
+"""
+
+import argparse
+import copy
+import glob
+import hashlib
+import json
+import os
+import pickle
+
+from atomic_file import file_stamp
+from content_digest import code_digest, file_digest
+from qa_autoplay_bot import QAAutoplayBot, np
+from feel_optimizer import FeelDataset, FeelOptimizer
+from studiobrain_decision import StudioBrain
+from memory_sync import update_memory_fields
+
+CACHE_VERSION = 1
+CACHE_ENTRIES_PER_STAGE = 8  # Most recently used results kept per stage; older ones are deleted
+QA_REPORT_PATH = 'docs/QA_Report.csv'
+# Stage code: a change to any of these invalidates every cached stage result
+CODE_MODULES = ['orchestrator.py', 'content_digest.py', 'qa_autoplay_bot.py', 'stack_slice_sim.py',
+                'feel_optimizer.py', 'studiobrain_decision.py']
+
+class Stage:
+    """One node of the pipeline graph
+    
+    `run` receives the results of `deps` positionally, then `params` and `options` as keywords.
+    Only `params` and the content of `input_files` are part of the cache key; `options` (like
+    worker counts) must not change the result. `slim(result)` gives the form that is cached
+    (the full result is still handed to this run's downstream stages) and `valid(result)`
+    rejects a cached result whose side effects on disk no longer hold.
+    """
+    
+    def __init__(self, name, run, deps=(), params=None, options=None, input_files=(), cacheable=True,
+                 slim=None, valid=None):
+        self.name = name
+        self.run = run
+        self.deps = list(deps)
+        self.params = params or {}
+        self.options = options or {}
+        self.input_files = [path for path in input_files if path]
+        self.cacheable = cacheable
+        self.slim = slim
+        self.valid = valid
+
+class PipelineOrchestrator:
+    """Runs stages in dependency order, reusing cached results for unchanged stages"""
+    
+    def __init__(self, cache_dir='docs/pipeline_cache', use_cache=True, max_entries=CACHE_ENTRIES_PER_STAGE):
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.max_entries = max_entries
+        self.stages = {}
+        self.results = {}
+        self.keys = {}
+        self.cached = set()
+        self._code_digest = code_digest(CODE_MODULES)
+    
+    def add(self, stage):
+        self.stages[stage.name] = stage
+        return stage
+    
+    def order(self):
+        """Stages in topological order (insertion order among independent stages)"""
+        ordered, placed = [], set()
+        for name, stage in self.stages.items():
+            unknown = [dep for dep in stage.deps if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage '{name}' depends on unknown stages {unknown}")
+        
+        remaining = list(self.stages.values())
+        while remaining:
+            ready = [stage for stage in remaining if all(dep in placed for dep in stage.deps)]
+            if not ready:
+                raise ValueError(f"Dependency cycle among stages {[stage.name for stage in remaining]}")
+            for stage in ready:
+                ordered.append(stage)
+                placed.add(stage.name)
+            remaining = [stage for stage in remaining if stage.name not in placed]
+        return ordered
+    
+    def stage_key(self, stage):
+        """Hash of a stage's code, parameters, input files and upstream keys; None if not cacheable"""
+        dep_keys = [self.keys[dep] for dep in stage.deps]
+        if not stage.cacheable or None in dep_keys:
+            return None
+        payload = json.dumps({
+            'version': CACHE_VERSION,
+            'code': self._code_digest,
+            'stage': stage.name,
+            'params': stage.params,
+            'files': {path: file_digest(path) for path in stage.input_files},
+            'deps': dep_keys
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def cache_path(self, stage, key):
+        return os.path.join(self.cache_dir, f"{stage.name}-{key[:24]}.pkl")
+    
+    def load_cached(self, stage, key):
+        """Return a cached stage result or None"""
+        path = self.cache_path(stage, key)
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        if stage.valid is not None and not stage.valid(result):
+            return None
+        # Touched on use so pruning drops the least recently used entries
+        os.utime(path)
+        return result
+    
+    def store(self, stage, key, result):
+        """Write one stage result atomically, then prune the stage's oldest entries"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.cache_path(stage, key)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(stage.slim(result) if stage.slim else result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+        self.prune(stage)
+    
+    def prune(self, stage):
+        """Keep only the `max_entries` most recently used results of a stage"""
+        entries = []
+        for path in glob.glob(os.path.join(glob.escape(self.cache_dir), f"{stage.name}-*.pkl")):
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                continue
+        for _, path in sorted(entries, reverse=True)[self.max_entries:]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def run(self):
+        """Run (or restore) every stage; returns {stage name: result}"""
+        for stage in self.order():
+            key = self.stage_key(stage)
+            self.keys[stage.name] = key
+            
+            result = self.load_cached(stage, key) if key and self.use_cache else None
+            if result is not None:
+                self.cached.add(stage.name)
+                print(f"[Pipeline] {stage.name}: unchanged inputs, using cached result")
+            else:
+                print(f"[Pipeline] {stage.name}: running")
+                result = stage.run(*[self.results[dep] for dep in stage.deps], **stage.params, **stage.options)
+                if key:
+                    self.store(stage, key, result)
+            self.results[stage.name] = result
+        return self.results
+
+def run_qa_stage(runs, seed, batch, gameplay, workers=1):
+    """Simulate sessions, write QA_Report.csv and keep the sessions in memory for the FEEL stage"""
+    bot = QAAutoplayBot(seed=seed)
+    bot.simulation_runs = runs
+    if gameplay:
+        bot.engine = 'gameplay'
+    if batch or gameplay:
+        bot.run_batch_simulation(seed=seed, workers=workers)
+    else:
+        bot.run_simulation()
+    bot.generate_csv_report()
+    bot.report_stamp = file_stamp(QA_REPORT_PATH)
+    return bot
+
+def slim_qa_result(bot):
+    """Cached form of the qa stage: running stats and the report stamp, without the sessions"""
+    slim = copy.copy(bot)
+    slim.columns = None
+    slim.simulation_data = []
+    return slim
+
+def qa_report_current(bot):
+    """Whether QA_Report.csv is still the report this qa result wrote (the sessions live only there)"""
+    return file_stamp(QA_REPORT_PATH) == bot.report_stamp
+
+def run_feel_stage(bot, retention_path, bootstrap, confidence, seed):
+    """Score FEEL from the bot's sessions, or from its report when the qa result came from the cache"""
+    optimizer = FeelOptimizer()
+    if bot.columns is not None:
+        optimizer.dataset = FeelDataset(bot.columns)
+    elif bot.simulation_data:
+        optimizer.dataset = FeelDataset.from_records(bot.simulation_data)
+    elif not optimizer.load_qa_data(QA_REPORT_PATH):
+        raise RuntimeError(f"{QA_REPORT_PATH} is missing; rerun with --no-cache")
+    if retention_path:
+        optimizer.load_retention_curve(retention_path)
+    
+    optimizer.calculate_feel_score()
+    if bootstrap:
+        optimizer.bootstrap_feel(bootstrap, confidence=confidence, seed=seed)
+    # Reports only need the aggregates; keeping the columns would copy every session into the cache
+    optimizer.dataset = FeelDataset(base_stats=optimizer.dataset.stats())
+    return optimizer
+
+def run_decision_stage(bot, optimizer, robustness, seed):
+    """Decide from the QA and FEEL results handed over in memory"""
+    brain = StudioBrain()
+    feel_ci = optimizer.bootstrap_result['intervals']['feel'] if optimizer.bootstrap_result else None
+    brain.set_scores(bot.calculate_qa_score(), optimizer.feel_score, feel_ci)
+    brain.calculate_weighted_score()
+    brain.make_decision()
+    if robustness:
+        brain.analyze_robustness(robustness, seed=seed)
+    return brain
+
+def build_pipeline(runs=30, seed=None, batch=False, gameplay=False, workers=1, retention_path=None,
+                   bootstrap=0, confidence=0.95, robustness=0, use_cache=True):
+    """The QA -> FEEL -> StudioBrain graph; unseeded QA runs are random, so nothing downstream is cached"""
+    pipeline = PipelineOrchestrator(use_cache=use_cache)
+    pipeline.add(Stage('qa', run_qa_stage,
+                       params={'runs': runs, 'seed': seed, 'batch': batch, 'gameplay': gameplay},
+                       options={'workers': workers}, cacheable=seed is not None,
+                       slim=slim_qa_result, valid=qa_report_current))
+    pipeline.add(Stage('feel', run_feel_stage, deps=['qa'],
+                       params={'retention_path': retention_path, 'bootstrap': bootstrap,
+                               'confidence': confidence, 'seed': seed},
+                       input_files=[retention_path]))
+    pipeline.add(Stage('decision', run_decision_stage, deps=['qa', 'feel'],
+                       params={'robustness': robustness, 'seed': seed}))
+    return pipeline
+
+def publish_results(pipeline):
+    """Write reports and memory once, after every stage has finished (the qa stage writes the CSV)"""
+    bot = pipeline.results['qa']
+    optimizer = pipeline.results['feel']
+    brain = pipeline.results['decision']
+    
+    bot.generate_md_report()
+    optimizer.generate_feel_report()
+    brain.generate_decision_report()
+    
+    fields = {"last_qa": bot.calculate_qa_score(), "last_feel": optimizer.feel_score}
+    if optimizer.bootstrap_result:
+        fields["last_feel_ci"] = list(optimizer.bootstrap_result['intervals']['feel'])
+        update_memory_fields(fields)
+    else:
+        update_memory_fields(fields, remove=["last_feel_ci"])
+    brain.execute_decision()
+
+def main():
+    """Main function to run the QA -> FEEL -> StudioBrain pipeline in one process"""
+    parser = argparse.ArgumentParser(description="QA -> FEEL -> StudioBrain pipeline for Stack & Slice")
+    parser.add_argument('--runs', type=int, default=30, help="Number of sessions to simulate")
+    parser.add_argument('--batch', action='store_true', help="Use the NumPy batch engine")
+    parser.add_argument('--gameplay', action='store_true',
+                        help="Play sessions in the headless Stack & Slice simulator (implies --batch)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Random seed; stage results are only cached for seeded runs")
+    parser.add_argument('--workers', type=int, default=1, help="Process pool size for --batch runs")
+    parser.add_argument('--retention', default=None, metavar='PATH',
+                        help="Score retention with a population_sim retention curve")
+    parser.add_argument('--bootstrap', type=int, default=0, metavar='RESAMPLES',
+                        help="Add FEEL bootstrap confidence intervals")
+    parser.add_argument('--confidence', type=float, default=0.95, help="Bootstrap interval confidence level")
+    parser.add_argument('--robustness', type=int, default=0, metavar='SCENARIOS',
+                        help="Add a decision-robustness analysis")
+    parser.add_argument('--no-cache', action='store_true', help="Rerun every stage")
+    args = parser.parse_args()
+    
+    if (args.batch or args.gameplay or args.bootstrap or args.robustness) and np is None:
+        print("[Pipeline] Error: --batch, --gameplay, --bootstrap and --robustness require NumPy (pip install numpy)")
+        return
+    
+    os.makedirs('docs', exist_ok=True)
+    pipeline = build_pipeline(args.runs, seed=args.seed, batch=args.batch, gameplay=args.gameplay,
+                              workers=args.workers, retention_path=args.retention, bootstrap=args.bootstrap,
+                              confidence=args.confidence, robustness=args.robustness,
+                              use_cache=not args.no_cache)
+    pipeline.run()
+    publish_results(pipeline)
+    
+    brain = pipeline.results['decision']
+    cached = ', '.join(sorted(pipeline.cached)) or 'none'
+    print(f"[Pipeline] Complete. Decision: {brain.decision} (cached stages: {cached})")
+
+if __name__ == "__main__":
+    main()
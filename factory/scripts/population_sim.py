@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Player Population Simulator for Stack & Slice
+Cohorts of players with skill growth and outcome-driven churn over many sessions
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from artifact_manifest import write_artifact
+from qa_autoplay_bot import QAStats, np
+from feel_optimizer import FeelDataset, FeelOptimizer
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+class PopulationSim:
+    """Players x sessions simulation, vectorized over players and stepped session by session"""
+    
+    def __init__(self):
+        # Cohorts: share of players and skill distribution in logit units (0.9 ~ 71% attempt success)
+        self.cohorts = [
+            {'name': 'casual', 'share': 0.6, 'skill_mean': 0.3, 'skill_sd': 0.6},
+            {'name': 'core', 'share': 0.3, 'skill_mean': 0.9, 'skill_sd': 0.5},
+            {'name': 'hardcore', 'share': 0.1, 'skill_mean': 1.6, 'skill_sd': 0.4}
+        ]
+        self.sessions = 50
+        self.chunk_size = 250_000  # Players simulated together in one worker
+        
+        # Skill growth
+        self.learning_rate = 0.03  # Logit skill gained per attempt played
+        self.max_skill = 3.5
+        self.attempt_noise = 0.4  # Std dev of per-attempt form around the player's skill
+        self.perfect_offset = 3.0  # Perfect chance is sigmoid(skill - perfect_offset) on a clear
+        
+        # Sessions
+        self.max_restarts = 3
+        self.retry_probability = 0.6  # Chance of another attempt after a failed one
+        self.attempt_duration = (20, 50)  # Seconds per attempt
+        
+        # Churn probability after each session
+        self.churn_base = 0.04
+        self.churn_fail = 0.10  # Added when the session ended in a failure
+        self.churn_per_restart = 0.02
+        self.churn_perfect = -0.03  # A perfect session makes players more likely to return
+        self.churn_floor = 0.005
+    
+    def get_config(self):
+        """Return the population parameters"""
+        return dict(vars(self))
+    
+    def set_config(self, config):
+        """Apply population parameters produced by get_config"""
+        for key, value in config.items():
+            setattr(self, key, value)
+    
+    def simulate_players(self, count, rng):
+        """Simulate `count` players; return per-session active counts by cohort, QA stats and clears"""
+        shares = np.array([cohort['share'] for cohort in self.cohorts], dtype=float)
+        cohort = rng.choice(len(self.cohorts), size=count, p=shares / shares.sum())
+        means = np.array([c['skill_mean'] for c in self.cohorts])
+        sds = np.array([c['skill_sd'] for c in self.cohorts])
+        skill = means[cohort] + rng.standard_normal(count) * sds[cohort]
+        
+        active_by_cohort = np.zeros((self.sessions, len(self.cohorts)), dtype=np.int64)
+        successes = np.zeros(self.sessions, dtype=np.int64)
+        stats = QAStats()
+        low, high = self.attempt_duration
+        
+        for session in range(self.sessions):
+            n = len(skill)
+            if n == 0:
+                break
+            active_by_cohort[session] = np.bincount(cohort, minlength=len(self.cohorts))
+            
+            # Attempts until a clear, a quit or the restart cap
+            success = np.zeros(n, dtype=bool)
+            playing = np.ones(n, dtype=bool)
+            attempts = np.zeros(n, dtype=np.int16)
+            form = skill
+            for attempt in range(self.max_restarts + 1):
+                form = np.where(playing, skill + rng.standard_normal(n) * self.attempt_noise, form)
+                cleared = playing & (rng.random(n) < _sigmoid(form))
+                attempts += playing
+                success |= cleared
+                playing &= ~cleared
+                if attempt < self.max_restarts:
+                    playing &= rng.random(n) < self.retry_probability
+            
+            attempt_rate = _sigmoid(form)
+            perfect = success & (rng.random(n) < _sigmoid(form - self.perfect_offset))
+            perfect_count = np.where(perfect, rng.integers(1, 6, n), 0)
+            duration = (attempts * rng.uniform(low, high, n)).round(2)
+            # Stronger players get further up the stack before a failed attempt
+            fail_point = np.where(success, 1.0, rng.uniform(0.3, 0.3 + 0.5 * attempt_rate, n).round(2))
+            restart_count = attempts - 1
+            
+            stats.add_columns({
+                'success': success,
+                'perfect': perfect,
+                'session_duration': duration,
+                'restart_count': restart_count,
+                'fail_point': fail_point,
+                'perfect_count': perfect_count,
+                'perfect_per_min': (perfect_count / duration * 60).round(2)
+            })
+            successes[session] = success.sum()
+            
+            # Practice improves skill; outcomes drive churn
+            skill = np.minimum(skill + self.learning_rate * attempts, self.max_skill)
+            churn = (self.churn_base + self.churn_fail * ~success +
+                     self.churn_per_restart * restart_count + self.churn_perfect * perfect)
+            stay = rng.random(n) >= np.maximum(churn, self.churn_floor)
+            skill, cohort = skill[stay], cohort[stay]
+        
+        return active_by_cohort, stats, successes
+
+def _run_population_chunk(config, seed_sequence, count):
+    """Simulate one chunk of players (process pool worker)"""
+    sim = PopulationSim()
+    sim.set_config(config)
+    return sim.simulate_players(count, np.random.default_rng(seed_sequence))
+
+def run_population(sim, players, seed=None, workers=1):
+    """Simulate the whole population in fixed chunks; returns the population summary"""
+    if np is None:
+        raise RuntimeError("Population simulation requires NumPy (pip install numpy)")
+    
+    # Chunk layout depends only on seed and player count, never on worker count
+    counts = [min(sim.chunk_size, players - start) for start in range(0, players, sim.chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    config = sim.get_config()
+    
+    active_by_cohort = np.zeros((sim.sessions, len(sim.cohorts)), dtype=np.int64)
+    successes = np.zeros(sim.sessions, dtype=np.int64)
+    stats = QAStats()
+    
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_population_chunk, [config] * len(counts), seeds, counts))
+    else:
+        results = map(_run_population_chunk, [config] * len(counts), seeds, counts)
+    
+    for chunk_active, chunk_stats, chunk_successes in results:
+        active_by_cohort += chunk_active
+        successes += chunk_successes
+        stats.merge(chunk_stats)
+    
+    active = active_by_cohort.sum(axis=1)
+    cohort_sizes = np.maximum(active_by_cohort[0], 1)
+    return {
+        'players': players,
+        'sessions': sim.sessions,
+        'retention': (active / max(players, 1)).round(6).tolist(),
+        'cohort_retention': {
+            cohort['name']: (active_by_cohort[:, index] / cohort_sizes[index]).round(6).tolist()
+            for index, cohort in enumerate(sim.cohorts)
+        },
+        'session_success_rate': (successes / np.maximum(active, 1)).round(6).tolist(),
+        'stats': stats.to_dict()
+    }
+
+def save_population(summary, path='docs/RETENTION.json'):
+    """Write the retention curves and session stats for FeelOptimizer"""
+    if write_artifact(path, json.dumps(summary, indent=2)):
+        print(f"[PopulationSim] Retention curves saved: {path}")
+    else:
+        print(f"[PopulationSim] Retention curves unchanged: {path}")
+
+def main():
+    """Main function to simulate a player population"""
+    parser = argparse.ArgumentParser(description="Player population simulation for Stack & Slice")
+    parser.add_argument('--players', type=int, default=100_000, help="Number of players")
+    parser.add_argument('--sessions', type=int, default=50, help="Sessions per player")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes")
+    parser.add_argument('--output', default='docs/RETENTION.json', help="Retention curve path")
+    args = parser.parse_args()
+    
+    if np is None:
+        print("[PopulationSim] Error: NumPy is required (pip install numpy)")
+        return
+    
+    sim = PopulationSim()
+    sim.sessions = args.sessions
+    print(f"[PopulationSim] Simulating {args.players} players x {args.sessions} sessions...")
+    summary = run_population(sim, args.players, seed=args.seed, workers=args.workers)
+    
+    retention = summary['retention']
+    for day in (1, 7, 30):
+        if day < len(retention):
+            print(f"  - Session {day} retention: {retention[day]:.1%}")
+    for name, curve in summary['cohort_retention'].items():
+        print(f"  - {name.title()} retention at session {len(curve) - 1}: {curve[-1]:.1%}")
+    
+    os.makedirs('docs', exist_ok=True)
+    save_population(summary, args.output)
+    
+    optimizer = FeelOptimizer()
+    optimizer.dataset = FeelDataset(base_stats=QAStats.from_dict(summary['stats']))
+    optimizer.retention_curve = retention
+    print(f"[PopulationSim] Population FEEL score: {optimizer.score_feel()[0]:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,452 @@
 """
 QA Autoplay Bot for Stack & Slice
 Simulates 30 games with 70% success rate, 10% perfect rate
+Large runs (--runs N --batch) use a NumPy-backed batch engine
 """
 
+import argparse
 import random
 import csv
 import json
+import os
+from collections import deque
 from datetime import datetime
+from itertools import islice
 import math
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
 
-class QAAutoplayBot:
+try:
+    import numpy as np
+except ImportError:  # Only the batch engine needs NumPy
+    np = None
+
+from artifact_manifest import write_artifact
+from memory_sync import update_memory_field
+from stack_slice_sim import StackSliceSim
+
+CSV_FIELDNAMES = [
+    'game_id', 'timestamp', 'success', 'perfect', 'session_duration',
+    'restart_count', 'fail_point', 'perfect_count', 'perfect_per_min',
+    'actual_success_rate'
+]
+
+# QA score component weights
+QA_WEIGHTS = {'success': 0.4, 'perfect': 0.3, 'session': 0.2, 'restart': 0.1}
+
+# Typed column layout of the memory-mappable report (game_id is the row index + 1)
+COLUMNAR_SCHEMA = [
+    ('success', '|b1'),
+    ('perfect', '|b1'),
+    ('session_duration', '<f8'),
+    ('restart_count', '<i2'),
+    ('fail_point', '<f8'),
+    ('perfect_count', '<i2'),
+    ('perfect_per_min', '<f8'),
+    ('actual_success_rate', '<f8')
+]
+COLUMNAR_FORMAT = 'qa-columnar'
+COLUMNAR_VERSION = 2
+
+class RunningMoments:
+    """Welford running mean/variance that can be merged across shards"""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def add(self, value):
+        """Add a single observation"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    def add_array(self, values):
+        """Add a NumPy array of observations"""
+        if len(values) == 0:
+            return
+        batch = RunningMoments()
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        self.merge(batch)
+    
+    def merge(self, other):
+        """Merge another accumulator into this one (Chan et al. parallel update)"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+    
+    def variance(self):
+        """Population variance of the observations"""
+        return self.m2 / self.count if self.count else 0.0
+    
+    def std(self):
+        """Population standard deviation of the observations"""
+        return math.sqrt(self.variance())
+    
+    def to_dict(self):
+        """Serialize the accumulator state"""
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2}
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Restore an accumulator saved with to_dict"""
+        moments = cls()
+        moments.count, moments.mean, moments.m2 = data['count'], data['mean'], data['m2']
+        return moments
+
+class QAStats:
+    """Running counts and sums over game sessions, mergeable across shards"""
+    
     def __init__(self):
+        self.games = 0
+        self.successes = 0
+        self.perfects = 0
+        self.session_duration = 0.0
+        self.restart_count = 0
+        self.fail_point = 0.0
+        self.perfect_count = 0
+        self.perfect_per_min = 0.0
+        self.duration_moments = RunningMoments()
+    
+    def add(self, game_data):
+        """Accumulate one session record"""
+        self.games += 1
+        self.successes += 1 if game_data['success'] else 0
+        self.perfects += 1 if game_data['perfect'] else 0
+        self.session_duration += game_data['session_duration']
+        self.restart_count += game_data['restart_count']
+        self.fail_point += game_data['fail_point']
+        self.perfect_count += game_data['perfect_count']
+        self.perfect_per_min += game_data['perfect_per_min']
+        self.duration_moments.add(game_data['session_duration'])
+    
+    def add_columns(self, columns):
+        """Accumulate a batch of sessions given as NumPy column arrays"""
+        batch = QAStats()
+        batch.games = len(columns['success'])
+        batch.successes = int(columns['success'].sum())
+        batch.perfects = int(columns['perfect'].sum())
+        batch.session_duration = float(columns['session_duration'].sum())
+        batch.restart_count = int(columns['restart_count'].sum())
+        batch.fail_point = float(columns['fail_point'].sum())
+        batch.perfect_count = int(columns['perfect_count'].sum())
+        batch.perfect_per_min = float(columns['perfect_per_min'].sum())
+        batch.duration_moments.add_array(columns['session_duration'])
+        self.merge(batch)
+    
+    def merge(self, other):
+        """Merge another QAStats into this one"""
+        self.games += other.games
+        self.successes += other.successes
+        self.perfects += other.perfects
+        self.session_duration += other.session_duration
+        self.restart_count += other.restart_count
+        self.fail_point += other.fail_point
+        self.perfect_count += other.perfect_count
+        self.perfect_per_min += other.perfect_per_min
+        self.duration_moments.merge(other.duration_moments)
+    
+    def to_dict(self):
+        """Serialize the accumulator state (JSON-safe)"""
+        data = {name: value for name, value in vars(self).items() if name != 'duration_moments'}
+        data['duration_moments'] = self.duration_moments.to_dict()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Restore stats saved with to_dict"""
+        stats = cls()
+        for name, value in data.items():
+            if name == 'duration_moments':
+                stats.duration_moments = RunningMoments.from_dict(value)
+            else:
+                setattr(stats, name, value)
+        return stats
+
+def parse_report_row(row):
+    """Convert a QA_Report.csv row of strings back to typed session values"""
+    return {
+        'game_id': int(row['game_id']),
+        'timestamp': row['timestamp'],
+        'success': row['success'] == 'True',
+        'perfect': row['perfect'] == 'True',
+        'session_duration': float(row['session_duration']),
+        'restart_count': int(row['restart_count']),
+        'fail_point': float(row['fail_point']),
+        'perfect_count': int(row['perfect_count']),
+        'perfect_per_min': float(row['perfect_per_min']),
+        'actual_success_rate': float(row['actual_success_rate'])
+    }
+
+class QAReportWriter:
+    """Chunked CSV writer that streams session rows to QA_Report.csv during a run"""
+    
+    def __init__(self, csv_path='docs/QA_Report.csv', chunk_size=10_000):
+        self.csv_path = csv_path
+        self.chunk_size = chunk_size
+        self.rows_written = 0
+        self.buffer = []
+        self.file = None
+        self.writer = None
+    
+    def open(self, resume=False):
+        """Open the report, continuing after the last complete row when resuming"""
+        if resume and os.path.exists(self.csv_path) and os.path.getsize(self.csv_path) > 0:
+            self.rows_written = self._truncate_rows()
+            self.file = open(self.csv_path, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+            self.writer = csv.writer(self.file)
+        else:
+            self.rows_written = 0
+            self.file = open(self.csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(CSV_FIELDNAMES)
+        
+        self.buffer = []
+        return self.rows_written
+    
+    def _truncate_rows(self, max_rows=None):
+        """Drop a half-written trailing row (and rows past max_rows); return complete rows"""
+        with open(self.csv_path, 'r+b') as f:
+            header = f.readline()
+            if header.decode('utf-8').rstrip('\r\n') != ','.join(CSV_FIELDNAMES):
+                raise ValueError(f"{self.csv_path} is not a QA report (unexpected header)")
+            
+            rows = 0
+            position = last_row_end = f.tell()
+            for block in iter(lambda: f.read(1 << 20), b''):
+                newlines = block.count(b'\n')
+                if max_rows is not None and rows + newlines >= max_rows:
+                    # Cut right after the max_rows-th row
+                    end = -1
+                    for _ in range(max_rows - rows):
+                        end = block.index(b'\n', end + 1)
+                    rows = max_rows
+                    last_row_end = position + end + 1
+                    break
+                if newlines:
+                    rows += newlines
+                    last_row_end = position + block.rindex(b'\n') + 1
+                position += len(block)
+            
+            f.truncate(last_row_end)
+        return rows
+    
+    def truncate_rows(self, rows):
+        """Cut an opened report back to its first `rows` sessions"""
+        self.close()
+        self.rows_written = self._truncate_rows(rows)
+        self.file = open(self.csv_path, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+        self.writer = csv.writer(self.file)
+    
+    def load_stats(self):
+        """Rebuild running stats from the rows already on disk"""
+        stats = QAStats()
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as csvfile:
+            for row in csv.DictReader(csvfile):
+                stats.add(parse_report_row(row))
+        return stats
+    
+    def write_row(self, game_data):
+        """Buffer one session record, flushing when the chunk is full"""
+        self.buffer.append([game_data[name] for name in CSV_FIELDNAMES])
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+    
+    def write_columns(self, columns, timestamp):
+        """Buffer a batch of sessions given as NumPy column arrays"""
+        # tolist() converts each column to Python scalars in one call
+        values = [columns[name].tolist() for name in CSV_FIELDNAMES[2:]]
+        first_id = self.rows_written + len(self.buffer) + 1
+        for game_id, row in enumerate(zip(*values), start=first_id):
+            self.buffer.append((game_id, timestamp) + row)
+            if len(self.buffer) >= self.chunk_size:
+                self.flush()
+    
+    def flush(self):
+        """Write buffered rows as one bulk write and push them to disk"""
+        if self.buffer:
+            self.writer.writerows(self.buffer)
+            self.rows_written += len(self.buffer)
+            self.buffer = []
+        self.file.flush()
+    
+    def close(self):
+        """Flush remaining rows and close the report"""
+        if self.file is None:
+            return
+        self.flush()
+        self.file.close()
+        self.file = None
+
+class QAColumnarWriter:
+    """Chunked writer for the typed, memory-mappable columnar QA report"""
+    
+    def __init__(self, report_dir='docs/QA_Report.cols', chunk_size=10_000):
+        self.report_dir = report_dir
+        self.chunk_size = chunk_size
+        self.rows_written = 0
+        self.buffer = []
+        self.files = {}
+    
+    def column_path(self, name):
+        """Path of the raw little-endian data file for one column"""
+        return os.path.join(self.report_dir, f"{name}.bin")
+    
+    def open(self, resume=False):
+        """Open the column files, keeping complete rows when resuming"""
+        if np is None:
+            raise RuntimeError("Columnar reports require NumPy (pip install numpy)")
+        
+        os.makedirs(self.report_dir, exist_ok=True)
+        schema_path = os.path.join(self.report_dir, 'schema.json')
+        if resume and os.path.exists(schema_path):
+            # Shortest column wins; a half-written value is dropped with it
+            self.rows_written = min(
+                os.path.getsize(self.column_path(name)) // np.dtype(dtype).itemsize
+                if os.path.exists(self.column_path(name)) else 0
+                for name, dtype in COLUMNAR_SCHEMA
+            )
+        else:
+            self.rows_written = 0
+        
+        self.buffer = []
+        self.files = {}
+        for name, dtype in COLUMNAR_SCHEMA:
+            f = open(self.column_path(name), 'ab')
+            f.truncate(self.rows_written * np.dtype(dtype).itemsize)
+            self.files[name] = f
+        self._write_schema()
+        return self.rows_written
+    
+    def truncate_rows(self, rows):
+        """Cut an opened report back to its first `rows` sessions"""
+        self.flush()
+        for name, dtype in COLUMNAR_SCHEMA:
+            self.files[name].truncate(rows * np.dtype(dtype).itemsize)
+        self.rows_written = rows
+        self._write_schema()
+    
+    def load_stats(self):
+        """Rebuild running stats from the rows already on disk"""
+        stats = QAStats()
+        if self.rows_written:
+            stats.add_columns(load_columnar_report(self.report_dir))
+        return stats
+    
+    def write_row(self, game_data):
+        """Buffer one session record, flushing when the chunk is full"""
+        self.buffer.append(tuple(game_data[name] for name, _ in COLUMNAR_SCHEMA))
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+    
+    def write_columns(self, columns, timestamp):
+        """Append a batch of sessions given as NumPy column arrays"""
+        self.flush()
+        for name, dtype in COLUMNAR_SCHEMA:
+            np.asarray(columns[name], dtype=dtype).tofile(self.files[name])
+        self.rows_written += len(columns['success'])
+        self.flush()
+    
+    def flush(self):
+        """Write buffered rows column by column and publish the new row count"""
+        if self.buffer:
+            for index, (name, dtype) in enumerate(COLUMNAR_SCHEMA):
+                np.array([row[index] for row in self.buffer], dtype=dtype).tofile(self.files[name])
+            self.rows_written += len(self.buffer)
+            self.buffer = []
+        for f in self.files.values():
+            f.flush()
+        self._write_schema()
+    
+    def close(self):
+        """Flush remaining rows and close the column files"""
+        if not self.files:
+            return
+        self.flush()
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+    
+    def _write_schema(self):
+        """Atomically replace schema.json; readers never see more rows than it lists"""
+        schema = {
+            'format': COLUMNAR_FORMAT,
+            'version': COLUMNAR_VERSION,
+            'rows': self.rows_written,
+            'columns': [{'name': name, 'dtype': dtype} for name, dtype in COLUMNAR_SCHEMA],
+            'updated_at': datetime.now().isoformat()
+        }
+        schema_path = os.path.join(self.report_dir, 'schema.json')
+        with open(schema_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(schema, f, indent=2)
+        os.replace(schema_path + '.tmp', schema_path)
+
+def load_columnar_report(report_dir='docs/QA_Report.cols'):
+    """Memory-map every column of a columnar QA report (no parsing)"""
+    with open(os.path.join(report_dir, 'schema.json'), 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    
+    if schema.get('format') != COLUMNAR_FORMAT or schema.get('version') != COLUMNAR_VERSION:
+        raise ValueError(f"{report_dir} is not a version {COLUMNAR_VERSION} columnar QA report")
+    
+    rows = schema['rows']
+    columns = {}
+    for column in schema['columns']:
+        path = os.path.join(report_dir, f"{column['name']}.bin")
+        if rows:
+            columns[column['name']] = np.memmap(path, dtype=column['dtype'], mode='r', shape=(rows,))
+        else:
+            columns[column['name']] = np.zeros(0, dtype=column['dtype'])
+    return columns
+
+def _run_shard(config, seed_sequence, count, keep_columns=True):
+    """Simulate one shard of a batch run with its own RNG stream (process pool worker)"""
+    bot = QAAutoplayBot()
+    bot.set_config(config)
+    rng = np.random.default_rng(seed_sequence)
+    
+    stats = QAStats()
+    batches = []
+    completed = 0
+    while completed < count:
+        size = min(bot.batch_size, count - completed)
+        batch = bot.simulate_batch(size, rng)
+        stats.add_columns(batch)
+        if keep_columns:
+            batches.append(batch)
+        completed += size
+    
+    columns = None
+    if batches:
+        columns = {name: np.concatenate([batch[name] for batch in batches]) for name in batches[0]}
+    return stats, columns
+
+class QAAutoplayBot:
+    def __init__(self, seed=None):
         self.success_rate = 0.70
         self.perfect_rate = 0.10
         self.jitter_range = 0.08  # ±8% variation
         self.simulation_runs = 30
+        self.batch_size = 1_000_000  # Sessions drawn per NumPy batch
+        self.shard_size = 1_000_000  # Sessions per independently seeded shard
+        
+        # Batch engine: 'random' draws outcomes, 'gameplay' plays the headless simulator
+        self.engine = 'random'
+        self.gameplay_config = {}  # StackSliceSim parameter overrides
+        
+        # Private RNG so seeded scalar runs are reproducible
+        self.rng = random.Random(seed)
         
         # Game metrics
         self.metrics = {
@@ -25,23 +457,53 @@ class QAAutoplayBot:
             'perfect_per_min': 0.0
         }
         
+        # Every session feeds the running stats; storing the records is optional
+        self.stats = QAStats()
+        self.store_sessions = True
         self.simulation_data = []
+        
+        # Column arrays filled by the batch engine instead of simulation_data
+        self.columns = None
+        self.columns_timestamp = None
+        
+        # Confidence interval and gate verdict of an adaptive run
+        self.sequential_result = None
+        
+        # Optional streaming report outputs; resumed_rows are already on disk
+        self.report_writers = []
+        self.resumed_rows = 0
+    
+    def get_config(self):
+        """Return the tunable bot parameters"""
+        return {
+            'success_rate': self.success_rate,
+            'perfect_rate': self.perfect_rate,
+            'jitter_range': self.jitter_range,
+            'batch_size': self.batch_size,
+            'engine': self.engine,
+            'gameplay_config': dict(self.gameplay_config)
+        }
+    
+    def set_config(self, config):
+        """Apply bot parameters produced by get_config"""
+        for key, value in config.items():
+            setattr(self, key, value)
     
     def simulate_game(self, game_id):
         """Simulate a single game session"""
         # Add jitter to success rate
-        jitter = random.uniform(-self.jitter_range, self.jitter_range)
+        jitter = self.rng.uniform(-self.jitter_range, self.jitter_range)
         actual_success_rate = max(0.1, min(0.9, self.success_rate + jitter))
         
         # Determine game outcome
-        is_success = random.random() < actual_success_rate
-        is_perfect = is_success and random.random() < self.perfect_rate
+        is_success = self.rng.random() < actual_success_rate
+        is_perfect = is_success and self.rng.random() < self.perfect_rate
         
         # Generate session metrics
-        session_duration = random.uniform(30, 180)  # 30-180 seconds
-        restart_count = random.randint(0, 3) if not is_success else 0
-        fail_point = random.uniform(0.3, 0.8) if not is_success else 1.0
-        perfect_count = random.randint(1, 5) if is_perfect else 0
+        session_duration = self.rng.uniform(30, 180)  # 30-180 seconds
+        restart_count = self.rng.randint(0, 3) if not is_success else 0
+        fail_point = self.rng.uniform(0.3, 0.8) if not is_success else 1.0
+        perfect_count = self.rng.randint(1, 5) if is_perfect else 0
         
         # Calculate perfect per minute
         perfect_per_min = (perfect_count / session_duration) * 60 if session_duration > 0 else 0
@@ -61,13 +523,228 @@ class QAAutoplayBot:
         
         return game_data
     
+    def simulate_batch(self, count, rng):
+        """Simulate a batch of game sessions as NumPy column arrays"""
+        if self.engine == 'gameplay':
+            sim = StackSliceSim()
+            sim.set_config(self.gameplay_config)
+            return sim.simulate(count, rng)
+        
+        # Same distributions as simulate_game, drawn for the whole batch at once
+        jitter = rng.uniform(-self.jitter_range, self.jitter_range, count)
+        actual_success_rate = np.clip(self.success_rate + jitter, 0.1, 0.9)
+        
+        is_success = rng.random(count) < actual_success_rate
+        is_perfect = is_success & (rng.random(count) < self.perfect_rate)
+        
+        session_duration = rng.uniform(30, 180, count)
+        restart_count = np.where(is_success, 0, rng.integers(0, 4, count))
+        fail_point = np.where(is_success, 1.0, rng.uniform(0.3, 0.8, count))
+        perfect_count = np.where(is_perfect, rng.integers(1, 6, count), 0)
+        
+        perfect_per_min = perfect_count / session_duration * 60
+        
+        return {
+            'success': is_success,
+            'perfect': is_perfect,
+            'session_duration': np.round(session_duration, 2),
+            'restart_count': restart_count.astype(np.int16),
+            'fail_point': np.round(fail_point, 2),
+            'perfect_count': perfect_count.astype(np.int16),
+            'perfect_per_min': np.round(perfect_per_min, 2),
+            'actual_success_rate': np.round(actual_success_rate, 3)
+        }
+    
+    def attach_report_writers(self, writers, resume=False):
+        """Stream session rows to report writers while the simulation runs"""
+        self.report_writers = list(writers)
+        rows = [writer.open(resume=resume) for writer in self.report_writers]
+        self.resumed_rows = min(rows) if rows else 0
+        
+        # An interruption can leave one report a chunk ahead of the other
+        for writer, written in zip(self.report_writers, rows):
+            if written > self.resumed_rows:
+                writer.truncate_rows(self.resumed_rows)
+        
+        if self.resumed_rows:
+            # Rebuild the running stats from the rows that survived the interruption
+            self.stats.merge(self.report_writers[0].load_stats())
+            print(f"[QABalancer] Resuming after {self.resumed_rows} completed sessions")
+    
+    def plan_shards(self, seed=None):
+        """Split the run into fixed-size shards, each with its own seed sequence"""
+        root = np.random.SeedSequence(seed)
+        counts = [
+            min(self.shard_size, self.simulation_runs - start)
+            for start in range(0, self.simulation_runs, self.shard_size)
+        ]
+        # Shard layout depends only on seed and run count, never on worker count
+        return root, list(zip(root.spawn(len(counts)), counts))
+    
+    def run_batch_simulation(self, runs=None, seed=None, workers=1):
+        """Run the simulation with the NumPy batch engine, optionally across a process pool"""
+        if np is None:
+            raise RuntimeError("Batch simulation requires NumPy (pip install numpy)")
+        
+        if runs is not None:
+            self.simulation_runs = runs
+        
+        root, shards = self.plan_shards(seed)
+        print(f"[QABalancer] Starting {self.simulation_runs} batched autoplay simulations "
+              f"({len(shards)} shards, {workers} workers, seed {root.entropy})...")
+        
+        # A resumed run skips shards already on disk; the seed makes the rest identical
+        starts = [index * self.shard_size for index in range(len(shards))]
+        pending = [
+            (start, seq, count) for start, (seq, count) in zip(starts, shards)
+            if start + count > self.resumed_rows
+        ]
+        
+        config = self.get_config()
+        keep_columns = self.store_sessions or bool(self.report_writers)
+        kept = []
+        
+        def collect(start, shard_stats, columns):
+            skip = self.resumed_rows - start
+            if skip > 0:
+                columns = {name: column[skip:] for name, column in columns.items()}
+                shard_stats = QAStats()
+                shard_stats.add_columns(columns)
+            self.stats.merge(shard_stats)
+            timestamp = datetime.now().isoformat()
+            for writer in self.report_writers:
+                writer.write_columns(columns, timestamp)
+                writer.flush()
+            if self.store_sessions:
+                kept.append(columns)
+            print(f"[QABalancer] Completed shard {start // self.shard_size + 1}/{len(shards)}")
+        
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # At most two shards per worker are in flight, so finished columns wait in
+                # memory only until their turn instead of piling up for the whole run
+                queue = deque()
+                shards_left = iter(pending)
+                for start, seq, count in islice(shards_left, 2 * workers):
+                    queue.append((start, pool.submit(_run_shard, config, seq, count, keep_columns)))
+                # Collect in shard order so the merge is identical for any worker count
+                while queue:
+                    start, future = queue.popleft()
+                    for next_start, seq, count in islice(shards_left, 1):
+                        queue.append((next_start, pool.submit(_run_shard, config, seq, count, keep_columns)))
+                    collect(start, *future.result())
+        else:
+            for start, seq, count in pending:
+                collect(start, *_run_shard(config, seq, count, keep_columns))
+        
+        self.simulation_data = []
+        self.columns = None
+        if kept:
+            self.columns = {name: np.concatenate([columns[name] for columns in kept]) for name in kept[0]}
+        self.columns_timestamp = datetime.now().isoformat()
+        
+        self.calculate_metrics()
+        print(f"[QABalancer] Simulation complete! Success rate: {self.get_overall_success_rate():.1%}")
+    
+    def session_qa_contributions(self, columns):
+        """Per-session terms whose mean is the (unclipped) QA score"""
+        return (
+            columns['success'] * QA_WEIGHTS['success'] +
+            columns['perfect'] * QA_WEIGHTS['perfect'] +
+            columns['session_duration'] / 120 * QA_WEIGHTS['session'] +
+            (1.0 - columns['restart_count'] / 2) * QA_WEIGHTS['restart']
+        )
+    
+    def run_adaptive_simulation(self, threshold=0.85, confidence=0.95, look_size=2_000, seed=None):
+        """Simulate in batches until the QA score's confidence interval clears or misses the gate"""
+        if np is None:
+            raise RuntimeError("Adaptive simulation requires NumPy (pip install numpy)")
+        
+        budget = self.simulation_runs
+        max_looks = math.ceil(budget / look_size)
+        # Bonferroni over every planned look keeps the overall error rate at 1 - confidence
+        z = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * max_looks))
+        
+        print(f"[QABalancer] Starting adaptive autoplay (gate {threshold}, {confidence:.0%} confidence, "
+              f"up to {budget} sessions in looks of {look_size})...")
+        
+        rng = np.random.default_rng(seed)
+        contributions = RunningMoments()
+        kept = []
+        decision = 'INCONCLUSIVE'
+        lower, upper = 0.0, 1.0
+        completed = 0
+        while completed < budget:
+            count = min(look_size, budget - completed)
+            columns = self.simulate_batch(count, rng)
+            completed += count
+            
+            self.stats.add_columns(columns)
+            contributions.add_array(self.session_qa_contributions(columns))
+            timestamp = datetime.now().isoformat()
+            for writer in self.report_writers:
+                writer.write_columns(columns, timestamp)
+            if self.store_sessions:
+                kept.append(columns)
+            
+            self.calculate_metrics()
+            qa_score = self.calculate_qa_score()
+            half_width = z * contributions.std() / math.sqrt(contributions.count)
+            lower, upper = qa_score - half_width, qa_score + half_width
+            
+            if lower > threshold:
+                decision = 'PASS'
+                break
+            if upper < threshold:
+                decision = 'FAIL'
+                break
+        
+        games = self.stats.games
+        success_rate = self.get_overall_success_rate()
+        perfect_rate = self.get_overall_perfect_rate()
+        self.sequential_result = {
+            'decision': decision,
+            'threshold': threshold,
+            'confidence': confidence,
+            'budget': budget,
+            'sessions': games,
+            'qa_score_ci': (lower, upper),
+            'success_rate_ci': self._rate_interval(success_rate, games, z),
+            'perfect_rate_ci': self._rate_interval(perfect_rate, games, z)
+        }
+        
+        self.simulation_runs = games
+        self.simulation_data = []
+        self.columns = None
+        if kept:
+            self.columns = {name: np.concatenate([columns[name] for columns in kept]) for name in kept[0]}
+        self.columns_timestamp = datetime.now().isoformat()
+        
+        print(f"[QABalancer] Adaptive run stopped after {games}/{budget} sessions: {decision} "
+              f"(QA score CI {lower:.3f}-{upper:.3f})")
+        return decision
+    
+    def _rate_interval(self, rate, games, z):
+        """Normal-approximation interval for a session rate"""
+        half_width = z * math.sqrt(rate * (1 - rate) / games)
+        return max(0.0, rate - half_width), min(1.0, rate + half_width)
+    
     def run_simulation(self):
         """Run 30 game simulations"""
         print(f"[QABalancer] Starting {self.simulation_runs} autoplay simulations...")
         
-        for i in range(self.simulation_runs):
+        # Replay the draws of the sessions already on disk so a seeded resume continues the
+        # same random stream instead of repeating its first sessions
+        for i in range(self.resumed_rows):
+            self.simulate_game(i + 1)
+        
+        for i in range(self.resumed_rows, self.simulation_runs):
             game_data = self.simulate_game(i + 1)
-            self.simulation_data.append(game_data)
+            self.stats.add(game_data)
+            if self.store_sessions:
+                self.simulation_data.append(game_data)
+            for writer in self.report_writers:
+                writer.write_row(game_data)
             
             # Log progress
             if (i + 1) % 5 == 0:
@@ -77,50 +754,47 @@ class QAAutoplayBot:
         print(f"[QABalancer] Simulation complete! Success rate: {self.get_overall_success_rate():.1%}")
     
     def calculate_metrics(self):
-        """Calculate overall metrics from simulation data"""
-        if not self.simulation_data:
+        """Calculate overall metrics from the running session stats"""
+        stats = self.stats
+        if not stats.games:
             return
         
         # Calculate averages
-        total_duration = sum(game['session_duration'] for game in self.simulation_data)
-        total_restarts = sum(game['restart_count'] for game in self.simulation_data)
-        total_perfect = sum(game['perfect_count'] for game in self.simulation_data)
+        total_duration = stats.session_duration
+        total_restarts = stats.restart_count
+        total_perfect = stats.perfect_count
         
-        self.metrics['avg_session'] = total_duration / len(self.simulation_data)
-        self.metrics['restart_rate'] = total_restarts / len(self.simulation_data)
-        self.metrics['fail_point'] = sum(game['fail_point'] for game in self.simulation_data) / len(self.simulation_data)
+        self.metrics['avg_session'] = total_duration / stats.games
+        self.metrics['restart_rate'] = total_restarts / stats.games
+        self.metrics['fail_point'] = stats.fail_point / stats.games
         self.metrics['perfect_per_min'] = (total_perfect / total_duration) * 60 if total_duration > 0 else 0
     
     def get_overall_success_rate(self):
         """Calculate overall success rate"""
-        if not self.simulation_data:
+        if not self.stats.games:
             return 0.0
         
-        successful_games = sum(1 for game in self.simulation_data if game['success'])
-        return successful_games / len(self.simulation_data)
+        return self.stats.successes / self.stats.games
     
     def get_overall_perfect_rate(self):
         """Calculate overall perfect rate"""
-        if not self.simulation_data:
+        if not self.stats.games:
             return 0.0
         
-        perfect_games = sum(1 for game in self.simulation_data if game['perfect'])
-        return perfect_games / len(self.simulation_data)
+        return self.stats.perfects / self.stats.games
     
     def generate_csv_report(self):
         """Generate CSV report"""
         csv_path = 'docs/QA_Report.csv'
         
-        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'game_id', 'timestamp', 'success', 'perfect', 'session_duration',
-                'restart_count', 'fail_point', 'perfect_count', 'perfect_per_min',
-                'actual_success_rate'
-            ]
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.simulation_data)
+        writer = QAReportWriter(csv_path)
+        writer.open()
+        if self.columns is not None:
+            writer.write_columns(self.columns, self.columns_timestamp)
+        else:
+            for game_data in self.simulation_data:
+                writer.write_row(game_data)
+        writer.close()
         
         print(f"[QABalancer] CSV report generated: {csv_path}")
     
@@ -130,6 +804,7 @@ class QAAutoplayBot:
         
         success_rate = self.get_overall_success_rate()
         perfect_rate = self.get_overall_perfect_rate()
+        qa_score = self.calculate_qa_score()
         
         report_content = f"""# QA Autoplay Report
 
@@ -142,15 +817,16 @@ class QAAutoplayBot:
 
 ## Key Metrics
 - **Average Session Duration**: {self.metrics['avg_session']:.2f} seconds
+- **Session Duration Std Dev**: {self.stats.duration_moments.std():.2f} seconds
 - **Restart Rate**: {self.metrics['restart_rate']:.2f} per game
 - **Average Fail Point**: {self.metrics['fail_point']:.2f}
 - **Perfect per Minute**: {self.metrics['perfect_per_min']:.2f}
 
 ## Quality Assessment
-- **QA Score**: {self.calculate_qa_score():.2f}/1.0
-- **Status**: {'PASS' if self.calculate_qa_score() >= 0.85 else 'FAIL'}
+- **QA Score**: {qa_score:.2f}/1.0
+- **Status**: {'PASS' if qa_score >= 0.85 else 'FAIL'}
 
-## Recommendations
+{self.generate_sequential_summary()}## Recommendations
 {self.generate_recommendations()}
 
 ## Detailed Data
@@ -160,18 +836,32 @@ See `QA_Report.csv` for complete simulation data.
 *Generated by QABalancer at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 """
         
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        if write_artifact(md_path, report_content):
+            print(f"[QABalancer] Markdown report generated: {md_path}")
+        else:
+            print(f"[QABalancer] Markdown report unchanged: {md_path}")
+    
+    def generate_sequential_summary(self):
+        """Markdown section describing an adaptive run's stopping decision"""
+        result = self.sequential_result
+        if result is None:
+            return ""
         
-        print(f"[QABalancer] Markdown report generated: {md_path}")
+        return f"""## Sequential Gate
+- **Decision**: {result['decision']} after {result['sessions']} of {result['budget']} sessions
+- **QA Score CI ({result['confidence']:.0%})**: {result['qa_score_ci'][0]:.3f} - {result['qa_score_ci'][1]:.3f} (gate {result['threshold']})
+- **Success Rate CI**: {result['success_rate_ci'][0]:.1%} - {result['success_rate_ci'][1]:.1%}
+- **Perfect Rate CI**: {result['perfect_rate_ci'][0]:.1%} - {result['perfect_rate_ci'][1]:.1%}
+
+"""
     
     def calculate_qa_score(self):
         """Calculate QA score based on metrics"""
         # Weighted scoring
-        success_weight = 0.4
-        perfect_weight = 0.3
-        session_weight = 0.2
-        restart_weight = 0.1
+        success_weight = QA_WEIGHTS['success']
+        perfect_weight = QA_WEIGHTS['perfect']
+        session_weight = QA_WEIGHTS['session']
+        restart_weight = QA_WEIGHTS['restart']
         
         success_score = self.get_overall_success_rate()
         perfect_score = self.get_overall_perfect_rate()
@@ -213,30 +903,76 @@ See `QA_Report.csv` for complete simulation data.
 
 def main():
     """Main function to run QA autoplay simulation"""
+    parser = argparse.ArgumentParser(description="QA autoplay simulation for Stack & Slice")
+    parser.add_argument('--runs', type=int, default=None, help="Number of sessions to simulate (default: 30)")
+    parser.add_argument('--batch', action='store_true', help="Use the NumPy batch engine")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible runs")
+    parser.add_argument('--workers', type=int, default=1, help="Process pool size for --batch runs")
+    parser.add_argument('--gameplay', action='store_true',
+                        help="Play sessions in the headless Stack & Slice simulator (implies --batch)")
+    parser.add_argument('--stream', action='store_true',
+                        help="Keep only running stats in memory (constant memory)")
+    parser.add_argument('--chunk-size', type=int, default=10_000,
+                        help="Rows per QA_Report.csv write while the run is in progress")
+    parser.add_argument('--columnar', action='store_true',
+                        help="Also write the memory-mappable docs/QA_Report.cols report")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue an interrupted run from the rows already in QA_Report.csv")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="Stop as soon as the QA score clears or misses the 0.85 gate (--runs is the budget)")
+    parser.add_argument('--confidence', type=float, default=0.95, help="Confidence level for --adaptive")
+    parser.add_argument('--look-size', type=int, default=2_000, help="Sessions between --adaptive checks")
+    args = parser.parse_args()
+    args.batch = args.batch or args.gameplay
+    
+    if (args.batch or args.columnar or args.adaptive) and np is None:
+        print("[QABalancer] Error: --batch, --columnar and --adaptive require NumPy (pip install numpy)")
+        return
+    if args.adaptive and args.resume:
+        print("[QABalancer] Error: --adaptive runs cannot be resumed")
+        return
+    
     # Ensure docs directory exists
-    import os
     os.makedirs('docs', exist_ok=True)
     
     # Create and run bot
-    bot = QAAutoplayBot()
-    bot.run_simulation()
+    bot = QAAutoplayBot(seed=args.seed)
+    if args.runs is not None:
+        bot.simulation_runs = args.runs
+    bot.store_sessions = not args.stream
+    if args.gameplay:
+        bot.engine = 'gameplay'
+    
+    # Reports are written in chunks while the simulation runs
+    writers = [QAReportWriter(chunk_size=args.chunk_size)]
+    if args.columnar:
+        writers.append(QAColumnarWriter(chunk_size=args.chunk_size))
+    bot.attach_report_writers(writers, resume=args.resume)
+    try:
+        if args.adaptive:
+            if args.runs is None:
+                bot.simulation_runs = 1_000_000
+            bot.run_adaptive_simulation(confidence=args.confidence, look_size=args.look_size, seed=args.seed)
+        elif args.batch:
+            bot.run_batch_simulation(seed=args.seed, workers=args.workers)
+        else:
+            bot.run_simulation()
+    finally:
+        for writer in writers:
+            writer.close()
+    print(f"[QABalancer] CSV report generated: {writers[0].csv_path}")
+    if args.columnar:
+        print(f"[QABalancer] Columnar report generated: {writers[1].report_dir}")
     
+    save_qa_results(bot)
+
+def save_qa_results(bot):
+    """Write QA.md and record the QA score in MEMORY.json"""
     # Generate reports
-    bot.generate_csv_report()
     bot.generate_md_report()
     
     # Update memory
-    memory_path = 'docs/MEMORY.json'
-    try:
-        with open(memory_path, 'r') as f:
-            memory = json.load(f)
-    except FileNotFoundError:
-        memory = {"active_game": None, "build": 0, "last_qa": 0, "last_feel": 0, "pending": []}
-    
-    memory["last_qa"] = bot.calculate_qa_score()
-    
-    with open(memory_path, 'w') as f:
-        json.dump(memory, f, indent=2)
+    update_memory_field("last_qa", bot.calculate_qa_score())
     
     print(f"[QABalancer] QA simulation complete. QA Score: {bot.calculate_qa_score():.2f}")
 
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+QA Parameter Sweep for Stack & Slice
+Runs the autoplay bot over a grid or Latin-hypercube design with an on-disk result cache
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from qa_autoplay_bot import QAAutoplayBot, _run_shard, np
+from content_digest import code_digest
+from feel_optimizer import FeelDataset, FeelOptimizer
+from stack_slice_sim import StackSliceSim
+from studiobrain_decision import StudioBrain
+
+CACHE_VERSION = 2
+# Code a point's result depends on; editing any of these invalidates the cache
+SWEEP_MODULES = ['qa_sweep.py', 'content_digest.py', 'qa_autoplay_bot.py', 'stack_slice_sim.py', 'feel_optimizer.py']
+
+def parse_param(spec):
+    """Parse 'name=lo:hi[:steps]' into (name, lo, hi, steps)"""
+    name, _, bounds = spec.partition('=')
+    parts = bounds.split(':')
+    if not name or len(parts) not in (2, 3):
+        raise ValueError(f"Invalid --param '{spec}', expected name=lo:hi[:steps]")
+    steps = int(parts[2]) if len(parts) == 3 else None
+    return name, float(parts[0]), float(parts[1]), steps
+
+def grid_design(params, default_steps=5):
+    """Full factorial grid over (name, lo, hi, steps) ranges"""
+    points = [{}]
+    for name, lo, hi, steps in params:
+        values = np.linspace(lo, hi, steps or default_steps)
+        points = [dict(point, **{name: round(float(value), 6)}) for point in points for value in values]
+    return points
+
+def latin_hypercube(params, samples, rng):
+    """Latin-hypercube design: each range split into `samples` strata, one point per stratum"""
+    points = [{} for _ in range(samples)]
+    for name, lo, hi, _ in params:
+        strata = (rng.permutation(samples) + rng.random(samples)) / samples
+        for point, u in zip(points, strata):
+            point[name] = round(lo + (hi - lo) * float(u), 6)
+    return points
+
+def sweep_value(name, default, value):
+    """A design value in the parameter's own type: designs are float, counts and sizes are whole numbers"""
+    if isinstance(default, bool) or not isinstance(default, (int, float)):
+        raise ValueError(f"Sweep parameter '{name}' is not numeric")
+    if isinstance(default, int):
+        return int(round(value))
+    return value
+
+def point_config(base_config, point):
+    """Bot config with the sweep point applied (simulator names need the gameplay engine)"""
+    config = dict(base_config, gameplay_config=dict(base_config['gameplay_config']))
+    sim_params = StackSliceSim().get_config()
+    for name, value in point.items():
+        if name in config and name not in ('gameplay_config', 'engine'):
+            config[name] = sweep_value(name, config[name], value)
+        elif name in sim_params:
+            # The random engine never reads the simulator config, so the point would be a no-op
+            if config['engine'] != 'gameplay':
+                raise ValueError(f"Sweep parameter '{name}' is a gameplay simulator setting (use --gameplay)")
+            config['gameplay_config'][name] = sweep_value(name, sim_params[name], value)
+        else:
+            raise ValueError(f"Unknown sweep parameter '{name}'")
+    return config
+
+def cache_key(config, seed, runs, shard_size, code):
+    """Stable hash of everything that determines a point's result"""
+    payload = json.dumps({'version': CACHE_VERSION, 'code': code, 'config': config, 'seed': seed,
+                          'runs': runs, 'shard_size': shard_size}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def evaluate_point(config, seed, runs, shard_size):
+    """Run one sweep point (process pool worker); same shards and seeds as run_batch_simulation"""
+    bot = QAAutoplayBot()
+    bot.set_config(config)
+    bot.simulation_runs = runs
+    bot.shard_size = shard_size
+    
+    _, shards = bot.plan_shards(seed)
+    for seq, count in shards:
+        shard_stats, _ = _run_shard(config, seq, count, keep_columns=False)
+        bot.stats.merge(shard_stats)
+    bot.calculate_metrics()
+    
+    optimizer = FeelOptimizer()
+    optimizer.dataset = FeelDataset(base_stats=bot.stats)
+    
+    return {
+        'qa_score': bot.calculate_qa_score(),
+        'feel_score': optimizer.score_feel()[0],
+        'observed_success_rate': bot.get_overall_success_rate(),
+        'observed_perfect_rate': bot.get_overall_perfect_rate(),
+        'avg_session': bot.metrics['avg_session'],
+        'restart_rate': bot.metrics['restart_rate']
+    }
+
+class SweepRunner:
+    """Evaluates sweep points in parallel, reusing cached results"""
+    
+    def __init__(self, cache_dir='docs/sweep_cache', workers=1):
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.base_bot = QAAutoplayBot()
+        self._code_digest = code_digest(SWEEP_MODULES)
+    
+    def cache_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def load_cached(self, key):
+        """Return a cached point result or None"""
+        try:
+            with open(self.cache_path(key), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+    
+    def store(self, key, result):
+        """Write one point result atomically so an interrupted sweep keeps finished points"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.cache_path(key)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(result, f, indent=2)
+        os.replace(path + '.tmp', path)
+    
+    def run(self, points, seed, runs):
+        """Evaluate every point; returns one result row per point in design order"""
+        base_config = self.base_bot.get_config()
+        rows = [None] * len(points)
+        pending = []
+        for index, point in enumerate(points):
+            config = point_config(base_config, point)
+            key = cache_key(config, seed, runs, self.base_bot.shard_size, self._code_digest)
+            cached = self.load_cached(key)
+            if cached is not None:
+                rows[index] = dict(point, **cached, cached=True)
+            else:
+                pending.append((index, point, config, key))
+        
+        print(f"[QASweep] {len(points)} points: {len(points) - len(pending)} cached, {len(pending)} to run")
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(evaluate_point, config, seed, runs, self.base_bot.shard_size): (index, point, key)
+                for index, point, config, key in pending
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                index, point, key = futures[future]
+                result = future.result()
+                self.store(key, result)
+                rows[index] = dict(point, **result, cached=False)
+                print(f"[QASweep] Completed {done}/{len(pending)}: {point} -> "
+                      f"QA {result['qa_score']:.3f}, FEEL {result['feel_score']:.3f}")
+        
+        return rows
+
+def write_sweep_table(rows, param_names, csv_path='docs/SWEEP.csv'):
+    """Write the response-surface table (one row per point)"""
+    fieldnames = list(param_names) + [
+        'qa_score', 'feel_score', 'observed_success_rate', 'observed_perfect_rate',
+        'avg_session', 'restart_rate', 'weighted_score', 'decision', 'cached'
+    ]
+    with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"[QASweep] Sweep table generated: {csv_path}")
+
+def main():
+    """Main function to run a QA parameter sweep"""
+    parser = argparse.ArgumentParser(description="QA/FEEL parameter sweep for Stack & Slice")
+    parser.add_argument('--param', action='append', required=True, metavar='NAME=LO:HI[:STEPS]',
+                        help="Swept parameter; bot fields or, with --gameplay, simulator fields")
+    parser.add_argument('--lhs', type=int, default=None, metavar='SAMPLES',
+                        help="Latin-hypercube design with SAMPLES points instead of a grid")
+    parser.add_argument('--runs', type=int, default=100_000, help="Sessions per point")
+    parser.add_argument('--seed', type=int, default=0, help="Seed shared by every point")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Points evaluated in parallel")
+    parser.add_argument('--gameplay', action='store_true', help="Use the headless gameplay simulator")
+    parser.add_argument('--output', default='docs/SWEEP.csv', help="Sweep table path")
+    args = parser.parse_args()
+    
+    if np is None:
+        print("[QASweep] Error: NumPy is required (pip install numpy)")
+        return
+    
+    try:
+        params = [parse_param(spec) for spec in args.param]
+    except ValueError as e:
+        print(f"[QASweep] Error: {e}")
+        return
+    
+    if args.lhs:
+        points = latin_hypercube(params, args.lhs, np.random.default_rng(args.seed))
+    else:
+        points = grid_design(params)
+    
+    os.makedirs('docs', exist_ok=True)
+    runner = SweepRunner(workers=args.workers)
+    if args.gameplay:
+        runner.base_bot.engine = 'gameplay'
+    
+    try:
+        rows = runner.run(points, args.seed, args.runs)
+    except ValueError as e:
+        print(f"[QASweep] Error: {e}")
+        return
+    
+    # Score every point through StudioBrain in one vectorized call
+    brain = StudioBrain()
+    candidates = {'qa': [row['qa_score'] for row in rows], 'feel': [row['feel_score'] for row in rows]}
+    weighted, _, labels = brain.decide_batch(candidates)
+    for row, score, label in zip(rows, weighted, labels):
+        row['weighted_score'] = round(float(score), 6)
+        row['decision'] = str(label)
+    
+    write_sweep_table(rows, [name for name, _, _, _ in params], args.output)
+    
+    best = rows[brain.rank_candidates(candidates, top=1)[0]]
+    best_point = {name: best[name] for name, _, _, _ in params}
+    print(f"[QASweep] Best point {best_point}: weighted {best['weighted_score']:.3f} ({best['decision']}), "
+          f"QA {best['qa_score']:.3f}, FEEL {best['feel_score']:.3f}")
+
+if __name__ == "__main__":
+    main()
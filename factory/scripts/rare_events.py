@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Rare Outcome Estimator for Stack & Slice
+Importance-sampled perfect rate, restart-tail and early-fail frequencies for the autoplay bot
+"""
+
+import argparse
+import math
+import os
+from datetime import datetime
+
+from artifact_manifest import write_artifact
+from qa_autoplay_bot import QAAutoplayBot, RunningMoments, np
+
+RESTART_VALUES = 4  # The bot draws restart_count uniformly from 0..3 on a failed session
+FAIL_POINT_RANGE = (0.3, 0.8)  # The bot draws fail_point uniformly from this range on a failure
+
+def simulate_weighted(bot, count, rng, proposal):
+    """Simulate sessions from a biased proposal; return (columns, likelihood-ratio weights)
+    
+    The proposal may override 'success_rate', 'perfect_rate', 'restart_pmf' (over 0..3) and
+    'fail_window' = (mix, upper): with probability mix the fail point is drawn from
+    [0.3, upper) instead of the full range. Everything else follows simulate_batch.
+    """
+    weights = np.ones(count)
+    
+    jitter = rng.uniform(-bot.jitter_range, bot.jitter_range, count)
+    actual_success_rate = np.clip(bot.success_rate + jitter, 0.1, 0.9)
+    
+    q_success = proposal.get('success_rate', actual_success_rate)
+    is_success = rng.random(count) < q_success
+    weights *= np.where(is_success, actual_success_rate / q_success,
+                        (1 - actual_success_rate) / (1 - q_success))
+    
+    q_perfect = proposal.get('perfect_rate', bot.perfect_rate)
+    is_perfect = is_success & (rng.random(count) < q_perfect)
+    weights *= np.where(is_success,
+                        np.where(is_perfect, bot.perfect_rate / q_perfect,
+                                 (1 - bot.perfect_rate) / (1 - q_perfect)),
+                        1.0)
+    
+    session_duration = rng.uniform(30, 180, count)
+    
+    restart_pmf = np.asarray(proposal.get('restart_pmf', [1 / RESTART_VALUES] * RESTART_VALUES))
+    restarts = rng.choice(RESTART_VALUES, size=count, p=restart_pmf)
+    restart_count = np.where(is_success, 0, restarts)
+    weights *= np.where(is_success, 1.0, (1 / RESTART_VALUES) / restart_pmf[restarts])
+    
+    low, high = FAIL_POINT_RANGE
+    mix, upper = proposal.get('fail_window', (0.0, high))
+    in_window = rng.random(count) < mix
+    drawn = np.where(in_window, rng.uniform(low, upper, count), rng.uniform(low, high, count))
+    # Defensive mixture: the proposal density covers the whole base range
+    proposal_density = mix * (drawn < upper) / (upper - low) + (1 - mix) / (high - low)
+    fail_point = np.where(is_success, 1.0, drawn)
+    weights *= np.where(is_success, 1.0, (1 / (high - low)) / proposal_density)
+    
+    perfect_count = np.where(is_perfect, rng.integers(1, 6, count), 0)
+    perfect_per_min = perfect_count / session_duration * 60
+    
+    columns = {
+        'success': is_success,
+        'perfect': is_perfect,
+        'session_duration': np.round(session_duration, 2),
+        'restart_count': restart_count.astype(np.int16),
+        'fail_point': np.round(fail_point, 2),
+        'perfect_count': perfect_count.astype(np.int16),
+        'perfect_per_min': np.round(perfect_per_min, 2),
+        'actual_success_rate': np.round(actual_success_rate, 3)
+    }
+    return columns, weights
+
+class RareEventEstimator:
+    """Importance-sampling estimates of rare autoplay outcomes, one proposal per outcome"""
+    
+    def __init__(self, bot=None, restart_tail=3, fail_cut=0.35):
+        self.bot = bot or QAAutoplayBot()
+        self.restart_tail = restart_tail  # Tail event: restart_count >= restart_tail
+        self.fail_cut = fail_cut  # Early-fail event: failed with fail_point <= fail_cut
+        self.block_size = 100_000
+        self.results = {}
+    
+    def targets(self):
+        """(name, event(columns), proposal) for every estimated outcome"""
+        tail_pmf = np.full(RESTART_VALUES, 0.1 / self.restart_tail)
+        tail_pmf[self.restart_tail:] = 0.9 / (RESTART_VALUES - self.restart_tail)
+        # Cover the rounding of fail_point to two decimals
+        window = min(FAIL_POINT_RANGE[1], self.fail_cut + 0.005)
+        
+        return [
+            ('perfect_rate',
+             lambda c: c['perfect'],
+             {'success_rate': 0.95, 'perfect_rate': 0.9}),
+            (f'restarts>={self.restart_tail}',
+             lambda c: c['restart_count'] >= self.restart_tail,
+             {'success_rate': 0.1, 'restart_pmf': tail_pmf}),
+            (f'fail_point<={self.fail_cut}',
+             lambda c: ~c['success'] & (c['fail_point'] <= self.fail_cut),
+             {'success_rate': 0.1, 'fail_window': (0.9, window)})
+        ]
+    
+    def run(self, runs, seed=None, compare=False):
+        """Estimate every target from `runs` weighted sessions each (optionally plain MC too)"""
+        if np is None:
+            raise RuntimeError("Rare-event estimation requires NumPy (pip install numpy)")
+        if self.bot.engine != 'random':
+            raise ValueError("Importance sampling needs the random engine's closed-form likelihoods")
+        
+        targets = self.targets()
+        seeds = np.random.SeedSequence(seed).spawn(2 * len(targets))
+        
+        for index, (name, event, proposal) in enumerate(targets):
+            rng = np.random.default_rng(seeds[index])
+            weighted = self._estimate(runs, lambda n: simulate_weighted(self.bot, n, rng, proposal), event)
+            result = self._summarize(weighted)
+            
+            if compare:
+                plain_rng = np.random.default_rng(seeds[len(targets) + index])
+                plain = self._estimate(
+                    runs, lambda n: (self.bot.simulate_batch(n, plain_rng), None), event)
+                result['plain_estimate'] = plain.mean
+                result['plain_std_error'] = self._std_error(plain)
+            
+            self.results[name] = result
+            print(f"[RareEvents] {name}: {result['estimate']:.5f} ± {result['std_error']:.5f} "
+                  f"({result['variance_reduction']:.0f}x fewer sessions than plain MC)")
+        
+        return self.results
+    
+    def _estimate(self, runs, draw, event):
+        """Accumulate weighted event indicators in blocks"""
+        moments = RunningMoments()
+        for start in range(0, runs, self.block_size):
+            columns, weights = draw(min(self.block_size, runs - start))
+            hits = event(columns).astype(float)
+            moments.add_array(hits if weights is None else hits * weights)
+        return moments
+    
+    def _std_error(self, moments):
+        """Standard error of the mean of the accumulated observations"""
+        return math.sqrt(moments.variance() / moments.count) if moments.count else 0.0
+    
+    def _summarize(self, moments):
+        """Estimate, standard error and the equivalent plain Monte Carlo session count"""
+        estimate = moments.mean
+        std_error = self._std_error(moments)
+        plain_variance = estimate * (1 - estimate)  # Bernoulli variance of one plain session
+        reduction = plain_variance / moments.variance() if moments.variance() > 0 else float('inf')
+        return {
+            'estimate': estimate,
+            'std_error': std_error,
+            'sessions': moments.count,
+            'variance_reduction': reduction,
+            'plain_sessions_equivalent': moments.count * reduction
+        }
+    
+    def generate_report(self, report_path='docs/RARE_EVENTS.md'):
+        """Write the rare-outcome estimates"""
+        rows = []
+        for name, r in self.results.items():
+            plain = (f"{r['plain_estimate']:.5f} ± {r['plain_std_error']:.5f}"
+                     if 'plain_estimate' in r else 'n/a')
+            rows.append(f"| {name} | {r['estimate']:.5f} ± {r['std_error']:.5f} | {plain} | "
+                        f"{r['variance_reduction']:.0f}x | {r['plain_sessions_equivalent']:,.0f} |")
+        table = '\n'.join(rows)
+        
+        report_content = f"""# Rare Outcome Estimates
+
+## Importance Sampling
+| Outcome | Weighted Estimate | Plain MC | Variance Reduction | Plain Sessions Equivalent |
+|---------|-------------------|----------|--------------------|---------------------------|
+{table}
+
+- **Sessions per Outcome**: {next(iter(self.results.values()))['sessions'] if self.results else 0}
+- **Bot Config**: success {self.bot.success_rate}, perfect {self.bot.perfect_rate}, jitter ±{self.bot.jitter_range}
+
+---
+*Generated by QABalancer at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+"""
+        
+        if write_artifact(report_path, report_content):
+            print(f"[RareEvents] Rare outcome report generated: {report_path}")
+        else:
+            print(f"[RareEvents] Rare outcome report unchanged: {report_path}")
+        return report_path
+
+def main():
+    """Main function to estimate rare autoplay outcomes"""
+    parser = argparse.ArgumentParser(description="Importance-sampled rare outcome estimates")
+    parser.add_argument('--runs', type=int, default=20_000, help="Weighted sessions per outcome")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed")
+    parser.add_argument('--restart-tail', type=int, default=3, choices=range(1, RESTART_VALUES),
+                        help="Estimate P(restart_count >= N)")
+    parser.add_argument('--fail-cut', type=float, default=0.35, help="Estimate P(fail_point <= X) over failures")
+    parser.add_argument('--compare', action='store_true', help="Also run plain Monte Carlo at the same size")
+    args = parser.parse_args()
+    
+    if np is None:
+        print("[RareEvents] Error: NumPy is required (pip install numpy)")
+        return
+    
+    os.makedirs('docs', exist_ok=True)
+    estimator = RareEventEstimator(restart_tail=args.restart_tail, fail_cut=args.fail_cut)
+    estimator.run(args.runs, seed=args.seed, compare=args.compare)
+    estimator.generate_report()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Headless Stack & Slice Simulator
+Deterministic fixed-step simulation of the stack/slice loop played by a bot policy
+"""
+
+import argparse
+import time
+
+try:
+    import numpy as np
+except ImportError:  # The simulator is vectorized over games with NumPy
+    np = None
+
+class StackSliceSim:
+    """Fixed-step Stack & Slice simulation, vectorized across many games"""
+    
+    def __init__(self):
+        # Timing
+        self.tick_rate = 60  # Fixed update steps per second
+        self.spawn_delay = 0.6  # Seconds of drop animation between blocks
+        self.restart_delay = 1.5  # Seconds on the fail screen before a retry
+        
+        # Block and stack geometry (stack units)
+        self.block_width = 1.0
+        self.travel = 1.5  # Block slides between -travel and +travel
+        self.min_width = 0.05  # A thinner stack top ends the attempt
+        self.tolerance = 0.03  # Overhang forgiven on every cut
+        self.perfect_window = 0.016  # |offset| within this is a perfect cut (no slice)
+        
+        # Difficulty
+        self.base_speed = 1.2  # Units per second on the first block
+        self.speed_ramp = 0.04  # Speed gain per placed block
+        self.max_speed = 3.6
+        self.target_height = 40  # Blocks needed to clear the level
+        
+        # Bot policy
+        self.reaction_noise = 0.025  # Std dev of the bot's tap timing error (seconds)
+        self.reaction_bias = 0.0  # Mean tap timing error (seconds, positive = late)
+        self.skill_spread = 0.5  # Per-session noise multiplier spread (±50%)
+        self.max_restarts = 3
+        self.restart_probability = 0.6  # Chance the bot retries after a failed attempt
+        self.perfect_chain_goal = 5  # Perfect chain a cleared session needs to count as perfect
+    
+    def get_config(self):
+        """Return the simulation parameters"""
+        return dict(vars(self))
+    
+    def set_config(self, config):
+        """Apply simulation parameters produced by get_config"""
+        for key, value in config.items():
+            setattr(self, key, value)
+    
+    def simulate(self, count, rng):
+        """Play `count` sessions; return QA report columns from the gameplay"""
+        if np is None:
+            raise RuntimeError("The gameplay simulator requires NumPy (pip install numpy)")
+        
+        dt = 1.0 / self.tick_rate
+        
+        # Per-session results, filled in as sessions finish
+        out_success = np.zeros(count, dtype=bool)
+        out_perfect = np.zeros(count, dtype=bool)
+        out_duration = np.zeros(count)
+        out_restarts = np.zeros(count, dtype=np.int16)
+        out_fail_point = np.zeros(count)
+        out_perfect_count = np.zeros(count, dtype=np.int16)
+        out_cut_rate = np.zeros(count)
+        
+        # Compact per-game state for the sessions still playing
+        lane = np.arange(count)
+        noise_sd = (self.reaction_noise *
+                    (1.0 + rng.uniform(-self.skill_spread, self.skill_spread, count))).astype(np.float32)
+        level = np.zeros(count, dtype=np.int16)
+        restarts = np.zeros(count, dtype=np.int16)
+        width = np.full(count, self.block_width, dtype=np.float32)
+        center = np.zeros(count, dtype=np.float32)
+        pos = np.zeros(count, dtype=np.float32)
+        direction = np.ones(count, dtype=np.float32)
+        speed = np.zeros(count, dtype=np.float32)
+        tick = np.zeros(count, dtype=np.int32)
+        tap_tick = np.zeros(count, dtype=np.int32)
+        ticks_played = np.zeros(count, dtype=np.int32)
+        chain = np.zeros(count, dtype=np.int16)
+        best_chain = np.zeros(count, dtype=np.int16)
+        perfect_count = np.zeros(count, dtype=np.int16)
+        cuts = np.zeros(count, dtype=np.int16)
+        landed = np.zeros(count, dtype=np.int16)
+        playing = np.ones(count, dtype=bool)
+        
+        def spawn(idx):
+            # Blocks enter alternately from the left and the right
+            side = np.where(level[idx] % 2 == 0, -1.0, 1.0).astype(np.float32)
+            pos[idx] = side * self.travel
+            direction[idx] = -side
+            speed[idx] = np.minimum(self.base_speed * (1.0 + self.speed_ramp * level[idx]), self.max_speed)
+            tick[idx] = 0
+            # The bot aims for the moment the block lines up with the stack, with timing noise
+            aim = np.abs(center[idx] - pos[idx]) / speed[idx]
+            error = self.reaction_bias + rng.standard_normal(len(idx)) * noise_sd[idx]
+            tap_tick[idx] = np.maximum(1, np.rint((aim + error) / dt)).astype(np.int32)
+        
+        spawn(np.arange(count))
+        
+        while len(lane):
+            # Fixed-step block movement with bounces at the rails
+            pos += direction * speed * np.float32(dt)
+            over = pos > self.travel
+            under = pos < -self.travel
+            pos = np.where(over, 2 * self.travel - pos, np.where(under, -2 * self.travel - pos, pos))
+            direction = np.where(over, -1.0, np.where(under, 1.0, direction)).astype(np.float32)
+            tick += 1
+            ticks_played += 1
+            
+            tapped = np.flatnonzero(playing & (tick >= tap_tick))
+            if len(tapped) == 0:
+                continue
+            
+            # Cut: perfect taps keep the width, others lose the overhang beyond tolerance
+            offset = pos[tapped] - center[tapped]
+            is_perfect = np.abs(offset) <= self.perfect_window
+            overhang = np.where(is_perfect, 0.0, np.maximum(np.abs(offset) - self.tolerance, 0.0))
+            width[tapped] -= overhang
+            center[tapped] += np.sign(offset) * overhang / 2
+            
+            chain[tapped] = np.where(is_perfect, chain[tapped] + 1, 0)
+            best_chain[tapped] = np.maximum(best_chain[tapped], chain[tapped])
+            perfect_count[tapped] += is_perfect
+            cuts[tapped] += 1
+            
+            broke = width[tapped] < self.min_width
+            landed[tapped] += ~broke
+            level[tapped] += ~broke
+            cleared = ~broke & (level[tapped] >= self.target_height)
+            
+            retry = broke & (restarts[tapped] < self.max_restarts)
+            retry[retry] = rng.random(int(retry.sum())) < self.restart_probability
+            
+            finished = tapped[cleared | (broke & ~retry)]
+            if len(finished):
+                won = level[finished] >= self.target_height
+                ids = lane[finished]
+                out_success[ids] = won
+                out_perfect[ids] = won & (best_chain[finished] >= self.perfect_chain_goal)
+                out_duration[ids] = (ticks_played[finished] * dt + cuts[finished] * self.spawn_delay +
+                                     restarts[finished] * self.restart_delay)
+                out_restarts[ids] = restarts[finished]
+                out_fail_point[ids] = np.where(won, 1.0, level[finished] / self.target_height)
+                out_perfect_count[ids] = perfect_count[finished]
+                out_cut_rate[ids] = landed[finished] / cuts[finished]
+                playing[finished] = False
+            
+            restarted = tapped[retry]
+            if len(restarted):
+                restarts[restarted] += 1
+                level[restarted] = 0
+                width[restarted] = self.block_width
+                center[restarted] = 0.0
+                chain[restarted] = 0
+            
+            spawn(tapped[(~broke & ~cleared) | retry])
+            
+            # Drop finished sessions once they make up a quarter of the state arrays
+            if playing.sum() < 0.75 * len(lane):
+                keep = playing
+                lane, noise_sd, level, restarts = lane[keep], noise_sd[keep], level[keep], restarts[keep]
+                width, center, pos, direction = width[keep], center[keep], pos[keep], direction[keep]
+                speed, tick, tap_tick = speed[keep], tick[keep], tap_tick[keep]
+                ticks_played, chain, best_chain = ticks_played[keep], chain[keep], best_chain[keep]
+                perfect_count, cuts, landed = perfect_count[keep], cuts[keep], landed[keep]
+                playing = playing[keep]
+        
+        perfect_per_min = out_perfect_count / out_duration * 60
+        return {
+            'success': out_success,
+            'perfect': out_perfect,
+            'session_duration': np.round(out_duration, 2),
+            'restart_count': out_restarts,
+            'fail_point': np.round(out_fail_point, 2),
+            'perfect_count': out_perfect_count,
+            'perfect_per_min': np.round(perfect_per_min, 2),
+            'actual_success_rate': np.round(out_cut_rate, 3)
+        }
+
+def main():
+    """Benchmark the simulator and print gameplay outcome rates"""
+    parser = argparse.ArgumentParser(description="Headless Stack & Slice simulator")
+    parser.add_argument('--games', type=int, default=20_000, help="Number of sessions to play")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+    
+    if np is None:
+        print("[StackSliceSim] Error: NumPy is required (pip install numpy)")
+        return
+    
+    sim = StackSliceSim()
+    start = time.perf_counter()
+    columns = sim.simulate(args.games, np.random.default_rng(args.seed))
+    elapsed = time.perf_counter() - start
+    
+    print(f"[StackSliceSim] {args.games} games in {elapsed:.2f}s ({args.games / elapsed:,.0f} games/s)")
+    print(f"  - Success rate: {columns['success'].mean():.1%}")
+    print(f"  - Perfect rate: {columns['perfect'].mean():.1%}")
+    print(f"  - Avg session: {columns['session_duration'].mean():.1f}s")
+    print(f"  - Avg restarts: {columns['restart_count'].mean():.2f}")
+    print(f"  - Avg fail point: {columns['fail_point'].mean():.2f}")
+    print(f"  - Avg perfects: {columns['perfect_count'].mean():.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,23 @@ StudioBrain Decision Maker
 Makes decisions based on QA and FEEL scores
 """
 
+import argparse
+import csv
 import json
 import os
 from datetime import datetime
 
+from artifact_manifest import write_artifact
+from memory_sync import load_memory, memory_exists, record_decision, update_memory_field
+
+try:
+    import numpy as np
+except ImportError:  # Only the batch decision API needs NumPy
+    np = None
+
+# Decision labels indexed by decide_batch codes (0 = lowest band)
+DECISIONS = ['RETURN_TO_GDD', 'TUNING_REQUIRED', 'BUILD_EXPORT']
+
 class StudioBrain:
     def __init__(self):
         self.decision_threshold = 0.85
@@ -23,6 +36,27 @@ class StudioBrain:
             'compliance': 0.05
         }
         
+        # Components not measured yet are assumed at baseline
+        self.baseline_scores = {
+            'performance': 0.8,
+            'market': 0.8,
+            'monetization': 0.8,
+            'compliance': 0.9
+        }
+        
+        # Std dev of each component score for robustness analysis (feel is replaced by the bootstrap CI)
+        self.score_uncertainty = {
+            'feel': 0.03,
+            'qa': 0.02,
+            'performance': 0.05,
+            'market': 0.08,
+            'monetization': 0.08,
+            'compliance': 0.03
+        }
+        # Dirichlet concentration of the weight perturbations (higher = closer to self.weights)
+        self.weight_concentration = 200
+        self.robustness = None
+        
         self.qa_score = 0.0
         self.feel_score = 0.0
         self.weighted_score = 0.0
@@ -32,28 +66,31 @@ class StudioBrain:
     
     def load_scores(self):
         """Load QA and FEEL scores from memory"""
-        memory_path = 'docs/MEMORY.json'
-        
-        try:
-            with open(memory_path, 'r') as f:
-                memory = json.load(f)
-            
-            self.qa_score = memory.get('last_qa', 0.0)
-            self.feel_score = memory.get('last_feel', 0.0)
-            
-            print(f"[StudioBrain] Loaded scores - QA: {self.qa_score:.3f}, FEEL: {self.feel_score:.3f}")
-            return True
-        except FileNotFoundError:
+        if not memory_exists():
             print("[StudioBrain] Error: MEMORY.json not found")
             return False
+        
+        memory = load_memory()
+        self.set_scores(memory.get('last_qa', 0.0), memory.get('last_feel', 0.0), memory.get('last_feel_ci'))
+        
+        print(f"[StudioBrain] Loaded scores - QA: {self.qa_score:.3f}, FEEL: {self.feel_score:.3f}")
+        return True
+    
+    def set_scores(self, qa_score, feel_score, feel_ci=None):
+        """Use QA and FEEL scores (and the FEEL bootstrap interval, if any)"""
+        self.qa_score = qa_score
+        self.feel_score = feel_score
+        if feel_ci:
+            # 95% bootstrap interval from FeelOptimizer -> normal std dev
+            low, high = feel_ci
+            self.score_uncertainty['feel'] = max((high - low) / (2 * 1.96), 1e-6)
     
     def calculate_weighted_score(self):
         """Calculate weighted decision score"""
-        # Assume other scores are at baseline (0.8) for now
-        performance_score = 0.8
-        market_score = 0.8
-        monetization_score = 0.8
-        compliance_score = 0.9
+        performance_score = self.baseline_scores['performance']
+        market_score = self.baseline_scores['market']
+        monetization_score = self.baseline_scores['monetization']
+        compliance_score = self.baseline_scores['compliance']
         
         self.weighted_score = (
             self.feel_score * self.weights['feel'] +
@@ -67,6 +104,132 @@ class StudioBrain:
         print(f"[StudioBrain] Weighted Score: {self.weighted_score:.3f}")
         return self.weighted_score
     
+    def component_matrix(self, scores):
+        """(n, components) score matrix in self.weights order
+        
+        Accepts such a matrix directly or a dict of per-component arrays; components missing
+        from the dict are filled with their baseline score.
+        """
+        if np is None:
+            raise RuntimeError("The batch decision API requires NumPy (pip install numpy)")
+        if not isinstance(scores, dict):
+            matrix = np.asarray(scores, dtype=float)
+            if matrix.ndim != 2 or matrix.shape[1] != len(self.weights):
+                raise ValueError(f"Expected an (n, {len(self.weights)}) matrix in order {list(self.weights)}")
+            return matrix
+        
+        if not scores:
+            raise ValueError(f"No score components given, expected some of {list(self.weights)}")
+        unknown = set(scores) - set(self.weights)
+        if unknown:
+            raise ValueError(f"Unknown score components: {sorted(unknown)}")
+        count = len(next(iter(scores.values())))
+        columns = []
+        for name in self.weights:
+            if name in scores:
+                columns.append(np.asarray(scores[name], dtype=float))
+            elif name in self.baseline_scores:
+                columns.append(np.full(count, self.baseline_scores[name]))
+            else:
+                raise ValueError(f"Missing score component '{name}' (no baseline)")
+        return np.column_stack(columns)
+    
+    def decide_batch(self, scores):
+        """Weighted scores and decisions for many builds at once; returns (weighted, codes, labels)"""
+        matrix = self.component_matrix(scores)
+        weighted = matrix @ np.array(list(self.weights.values()))
+        codes = self.decision_codes(weighted)
+        return weighted, codes, np.array(DECISIONS)[codes]
+    
+    def decision_codes(self, weighted):
+        """Indices into DECISIONS; same bands as make_decision"""
+        return (weighted >= self.tuning_threshold).astype(np.int8) + (weighted >= self.decision_threshold)
+    
+    def rank_candidates(self, scores, top=None):
+        """Candidate indices ordered best first by weighted score"""
+        weighted, _, _ = self.decide_batch(scores)
+        order = np.argsort(-weighted, kind='stable')
+        return order if top is None else order[:top]
+    
+    def analyze_robustness(self, scenarios=1_000_000, seed=None):
+        """Monte Carlo decision probabilities under score uncertainty and Dirichlet-perturbed weights"""
+        if np is None:
+            raise RuntimeError("Robustness analysis requires NumPy (pip install numpy)")
+        
+        names = list(self.weights)
+        nominal = self.component_matrix({'feel': [self.feel_score], 'qa': [self.qa_score]})[0]
+        base_weights = np.array(list(self.weights.values()))
+        rng = np.random.default_rng(seed)
+        
+        spread = np.array([self.score_uncertainty[name] for name in names])
+        scores = np.clip(nominal + rng.standard_normal((scenarios, len(names))) * spread, 0.0, 1.0)
+        weights = rng.dirichlet(base_weights * self.weight_concentration, size=scenarios)
+        weighted = np.einsum('ij,ij->i', scores, weights)
+        codes = self.decision_codes(weighted)
+        
+        nominal_code = int(self.decision_codes(np.array([nominal @ base_weights]))[0])
+        probabilities = np.bincount(codes, minlength=len(DECISIONS)) / scenarios
+        
+        # Squared correlation with the weighted score: share of its variance each input drives
+        def variance_share(values):
+            centered = values - values.mean(axis=0)
+            target = weighted - weighted.mean()
+            covariance = centered.T @ target / scenarios
+            denominator = centered.std(axis=0) * target.std()
+            return np.divide(covariance, denominator, out=np.zeros_like(covariance),
+                             where=denominator > 0) ** 2
+        
+        score_share = variance_share(scores)
+        weight_share = variance_share(weights)
+        sensitivity = sorted(
+            ({'component': name, 'score_share': float(score_share[i]), 'weight_share': float(weight_share[i])}
+             for i, name in enumerate(names)),
+            key=lambda item: item['score_share'] + item['weight_share'], reverse=True
+        )
+        
+        stability = float(probabilities[nominal_code])
+        self.robustness = {
+            'scenarios': scenarios,
+            'nominal_decision': DECISIONS[nominal_code],
+            'probabilities': {label: float(p) for label, p in zip(DECISIONS, probabilities)},
+            'stability': stability,
+            'fragile': stability < 0.9,
+            'weighted_interval': tuple(float(v) for v in np.percentile(weighted, [2.5, 97.5])),
+            'sensitivity': sensitivity
+        }
+        
+        print(f"[StudioBrain] Robustness over {scenarios} scenarios: "
+              + ', '.join(f"{label} {p:.1%}" for label, p in self.robustness['probabilities'].items()))
+        print(f"[StudioBrain] {DECISIONS[nominal_code]} holds in {stability:.1%} of scenarios"
+              f"{' (FRAGILE)' if self.robustness['fragile'] else ''}; most sensitive to "
+              f"{sensitivity[0]['component']}")
+        return self.robustness
+    
+    def generate_robustness_summary(self):
+        """Robustness section for the decision report (empty without an analysis run)"""
+        if not self.robustness:
+            return ''
+        
+        r = self.robustness
+        labels = {'feel': 'FEEL', 'qa': 'QA'}
+        probabilities = '\n'.join(f"| {label} | {p:.1%} |" for label, p in r['probabilities'].items())
+        sensitivity = '\n'.join(f"| {labels.get(item['component'], item['component'].title())} | {item['score_share']:.1%} | {item['weight_share']:.1%} |"
+                                 for item in r['sensitivity'])
+        return f"""
+## Decision Robustness
+- **Scenarios**: {r['scenarios']:,} (score uncertainty + Dirichlet weight perturbation)
+- **Decision Stability**: {r['stability']:.1%} {'(FRAGILE)' if r['fragile'] else '(ROBUST)'}
+- **Weighted Score 95% Range**: {r['weighted_interval'][0]:.3f} - {r['weighted_interval'][1]:.3f}
+
+| Decision | Probability |
+|----------|-------------|
+{probabilities}
+
+| Component | Score Variance Share | Weight Variance Share |
+|-----------|----------------------|-----------------------|
+{sensitivity}
+"""
+    
     def make_decision(self):
         """Make decision based on scores"""
         if self.weighted_score >= self.decision_threshold:
@@ -208,17 +371,12 @@ class StudioBrain:
     
     def update_memory_with_decision(self):
         """Update memory with decision information"""
-        memory_path = 'docs/MEMORY.json'
+        memory = load_memory()
         
-        try:
-            with open(memory_path, 'r') as f:
-                memory = json.load(f)
-        except FileNotFoundError:
-            memory = {"active_game": None, "build": 0, "last_qa": 0, "last_feel": 0, "pending": []}
-        
-        # Add decision to pending
+        # Append the decision to the history; MEMORY.json keeps only the summary
         decision_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'game': memory.get('active_game'),
+            'build': memory.get('build'),
             'decision': self.decision,
             'weighted_score': self.weighted_score,
             'qa_score': self.qa_score,
@@ -227,13 +385,8 @@ class StudioBrain:
             'next_action': self.next_action
         }
         
-        if 'pending' not in memory:
-            memory['pending'] = []
-        
-        memory['pending'].append(decision_entry)
-        
-        with open(memory_path, 'w') as f:
-            json.dump(memory, f, indent=2)
+        record_decision(decision_entry)
+        update_memory_field('last_decision', self.decision)
         
         print(f"[StudioBrain] Memory updated with decision: {self.decision}")
     
@@ -265,11 +418,11 @@ class StudioBrain:
 |-----------|-------|--------|--------------|
 | FEEL | {self.feel_score:.3f} | 30% | {self.feel_score * 0.3:.3f} |
 | QA | {self.qa_score:.3f} | 25% | {self.qa_score * 0.25:.3f} |
-| Performance | 0.800 | 15% | 0.120 |
-| Market | 0.800 | 15% | 0.120 |
-| Monetization | 0.800 | 10% | 0.080 |
-| Compliance | 0.900 | 5% | 0.045 |
-
+| Performance | {self.baseline_scores['performance']:.3f} | 15% | {self.baseline_scores['performance'] * 0.15:.3f} |
+| Market | {self.baseline_scores['market']:.3f} | 15% | {self.baseline_scores['market'] * 0.15:.3f} |
+| Monetization | {self.baseline_scores['monetization']:.3f} | 10% | {self.baseline_scores['monetization'] * 0.1:.3f} |
+| Compliance | {self.baseline_scores['compliance']:.3f} | 5% | {self.baseline_scores['compliance'] * 0.05:.3f} |
+{self.generate_robustness_summary()}
 ## Recommendations
 {self.get_recommendations()}
 
@@ -277,10 +430,10 @@ class StudioBrain:
 *Generated by StudioBrain at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 """
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
-        
-        print(f"[StudioBrain] Decision report generated: {report_path}")
+        if write_artifact(report_path, report_content):
+            print(f"[StudioBrain] Decision report generated: {report_path}")
+        else:
+            print(f"[StudioBrain] Decision report unchanged: {report_path}")
         return report_path
     
     def get_recommendations(self):
@@ -294,11 +447,59 @@ class StudioBrain:
         else:
             return "- Review decision matrix\n- Analyze score components\n- Consider alternative approaches"
 
+def run_batch_decisions(brain, input_path, output_path='docs/DECISIONS.csv'):
+    """Decide every row of a CSV of component scores (feel/feel_score, qa/qa_score, ...; missing at baseline)"""
+    with open(input_path, 'r', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        rows = list(reader)
+        fieldnames = [name for name in reader.fieldnames or [] if name not in ('weighted_score', 'decision')]
+    
+    if not rows:
+        print(f"[StudioBrain] Error: No candidates in {input_path}")
+        return False
+    
+    # Sweep tables name the columns qa_score / feel_score
+    columns = {name: column for name in brain.weights for column in (name, f"{name}_score") if column in fieldnames}
+    scores = {name: [float(row[column]) for row in rows] for name, column in columns.items()}
+    weighted, _, labels = brain.decide_batch(scores)
+    
+    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames + ['weighted_score', 'decision'])
+        writer.writeheader()
+        for row, score, label in zip(rows, weighted, labels):
+            writer.writerow(dict(row, weighted_score=round(float(score), 6), decision=label))
+    
+    counts = {label: int((labels == label).sum()) for label in DECISIONS}
+    print(f"[StudioBrain] Decided {len(rows)} candidates: {counts}")
+    best = int(np.argmax(weighted))
+    print(f"[StudioBrain] Best candidate: row {best + 1} (weighted score {weighted[best]:.3f}, {labels[best]})")
+    print(f"[StudioBrain] Batch decisions written: {output_path}")
+    return True
+
 def main():
     """Main function to run StudioBrain decision making"""
-    import os
+    parser = argparse.ArgumentParser(description="StudioBrain decision making")
+    parser.add_argument('--batch', default=None, metavar='CSV',
+                        help="Decide many candidates from a CSV of component score columns")
+    parser.add_argument('--output', default='docs/DECISIONS.csv', help="Batch decision output path")
+    parser.add_argument('--robustness', type=int, default=0, metavar='SCENARIOS',
+                        help="Add a Monte Carlo decision-robustness analysis over SCENARIOS samples")
+    parser.add_argument('--seed', type=int, default=None, help="Robustness analysis random seed")
+    args = parser.parse_args()
+    
     os.makedirs('docs', exist_ok=True)
     
+    if (args.batch or args.robustness) and np is None:
+        print("[StudioBrain] Error: --batch and --robustness require NumPy (pip install numpy)")
+        return
+    
+    if args.batch:
+        try:
+            run_batch_decisions(StudioBrain(), args.batch, args.output)
+        except (FileNotFoundError, KeyError, ValueError) as e:
+            print(f"[StudioBrain] Error: {e}")
+        return
+    
     # Create StudioBrain
     brain = StudioBrain()
     
@@ -313,6 +514,9 @@ def main():
     # Make decision
     decision = brain.make_decision()
     
+    if args.robustness:
+        brain.analyze_robustness(args.robustness, seed=args.seed)
+    
     # Execute decision
     brain.execute_decision()
     